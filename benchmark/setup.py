@@ -42,7 +42,11 @@ setup(
             "flake8>=5.0",
             "mypy>=1.0",
             "pre-commit>=2.20",
-        ]
+        ],
+        "speedups": [
+            "orjson>=3.6",
+            "uvloop>=0.17; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
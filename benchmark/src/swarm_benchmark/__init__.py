@@ -9,8 +9,26 @@ __version__ = "1.0.0"
 __author__ = "Claude Flow Team"
 __email__ = "support@claude-flow.dev"
 
-from .core.models import Task, Agent, Result, Benchmark
-from .core.benchmark_engine import BenchmarkEngine
+# Exports are resolved lazily so that importing the package (e.g. for the
+# CLI or ``__version__``) does not load the whole core package.
+_LAZY_EXPORTS = {
+    "Task": ".core.models",
+    "Agent": ".core.models",
+    "Result": ".core.models",
+    "Benchmark": ".core.models",
+    "BenchmarkEngine": ".core.benchmark_engine",
+}
+
+
+def __getattr__(name):
+    """Import public exports on first access."""
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Task",
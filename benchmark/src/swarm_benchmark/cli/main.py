@@ -1,15 +1,66 @@
 """Main CLI interface for the swarm benchmark tool."""
 
 import click
-import asyncio
 import json
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from swarm_benchmark import __version__
-from swarm_benchmark.core.models import StrategyType, CoordinationMode, BenchmarkConfig
-from swarm_benchmark.core.benchmark_engine import BenchmarkEngine
-from swarm_benchmark.core.real_benchmark_engine import RealBenchmarkEngine
+
+# The engine and models pull in the whole core package; they are imported
+# inside the commands that need them so list/show/clean/--help stay fast.
+if TYPE_CHECKING:
+    from swarm_benchmark.core.models import BenchmarkConfig
+
+
+_STRATEGY_MAP = None
+_MODE_MAP = None
+
+
+def _strategy_map():
+    """Map --strategy choice strings to StrategyType members (built once)."""
+    global _STRATEGY_MAP
+    if _STRATEGY_MAP is None:
+        from swarm_benchmark.core.models import StrategyType
+        _STRATEGY_MAP = {s.name.lower(): s for s in StrategyType}
+    return _STRATEGY_MAP
+
+
+def _mode_map():
+    """Map --mode choice strings to CoordinationMode members (built once)."""
+    global _MODE_MAP
+    if _MODE_MAP is None:
+        from swarm_benchmark.core.models import CoordinationMode
+        _MODE_MAP = {m.name.lower(): m for m in CoordinationMode}
+    return _MODE_MAP
+
+
+def _build_config(**options) -> "BenchmarkConfig":
+    """Build a BenchmarkConfig, importing the models on first use."""
+    from swarm_benchmark.core.models import BenchmarkConfig
+    return BenchmarkConfig(**options)
+
+
+class EnumChoice(click.Choice):
+    """Choice parameter that converts the selected string to an enum member.
+    
+    ``members`` is a callable returning the choice -> member mapping so the
+    enum module is only imported once a command actually parses its options.
+    """
+    
+    def __init__(self, choices, members):
+        super().__init__(choices)
+        self._members = members
+    
+    def convert(self, value, param, ctx):
+        if not isinstance(value, str):
+            return value
+        member = self._members().get(value)
+        if member is not None:
+            return member
+        # Defer to Choice for normalization and the usage error message
+        return self._members()[super().convert(value, param, ctx)]
 
 
 @click.group()
@@ -31,11 +82,12 @@ def cli(ctx, verbose, config):
 @cli.command()
 @click.argument('objective')
 @click.option('--strategy', 
-              type=click.Choice(['auto', 'research', 'development', 'analysis', 'testing', 'optimization', 'maintenance']),
+              type=EnumChoice(['auto', 'research', 'development', 'analysis', 'testing', 'optimization', 'maintenance'],
+                              _strategy_map),
               default='auto',
               help='Execution strategy (default: auto)')
 @click.option('--mode',
-              type=click.Choice(['centralized', 'distributed', 'hierarchical', 'mesh', 'hybrid']),
+              type=EnumChoice(['centralized', 'distributed', 'hierarchical', 'mesh', 'hybrid'], _mode_map),
               default='centralized', 
               help='Coordination mode (default: centralized)')
 @click.option('--max-agents', type=int, default=5, help='Maximum agents (default: 5)')
@@ -67,11 +119,11 @@ def run(ctx, objective, strategy, mode, max_agents, max_tasks, timeout, task_tim
       swarm-benchmark run "Optimize performance" --mode distributed --monitor
     """
     # Create benchmark configuration
-    config = BenchmarkConfig(
-        name=name or f"benchmark-{strategy}-{mode}",
+    config = _build_config(
+        name=name or f"benchmark-{strategy.value}-{mode.value}",
         description=description or f"Benchmark: {objective}",
-        strategy=getattr(StrategyType, strategy.upper()),
-        mode=getattr(CoordinationMode, mode.upper()),
+        strategy=strategy,
+        mode=mode,
         max_agents=max_agents,
         max_tasks=max_tasks,
         timeout=timeout * 60,  # Convert to seconds
@@ -87,13 +139,13 @@ def run(ctx, objective, strategy, mode, max_agents, max_tasks, timeout, task_tim
     if ctx.obj.get('verbose'):
         click.echo(f"Running benchmark: {config.name}")
         click.echo(f"Objective: {objective}")
-        click.echo(f"Strategy: {strategy}")
-        click.echo(f"Mode: {mode}")
+        click.echo(f"Strategy: {strategy.value}")
+        click.echo(f"Mode: {mode.value}")
         click.echo(f"Real metrics: {'Enabled' if real_metrics else 'Disabled'}")
     
     # Run the benchmark
     try:
-        result = asyncio.run(_run_benchmark(objective, config, real_metrics))
+        result = _run_async(_run_benchmark(objective, config, real_metrics))
         
         if result:
             click.echo(f"✅ Benchmark completed successfully!")
@@ -122,7 +174,7 @@ def run(ctx, objective, strategy, mode, max_agents, max_tasks, timeout, task_tim
     return 0
 
 
-@cli.command()
+@cli.command(name='list')
 @click.option('--format', 'output_format', 
               type=click.Choice(['json', 'table', 'csv']),
               default='table',
@@ -131,7 +183,7 @@ def run(ctx, objective, strategy, mode, max_agents, max_tasks, timeout, task_tim
 @click.option('--filter-mode', help='Filter by coordination mode')
 @click.option('--limit', type=int, default=10, help='Limit number of results (default: 10)')
 @click.pass_context
-def list(ctx, output_format, filter_strategy, filter_mode, limit):
+def list_cmd(ctx, output_format, filter_strategy, filter_mode, limit):
     """List recent benchmark runs."""
     try:
         benchmarks = _get_recent_benchmarks(filter_strategy, filter_mode, limit)
@@ -139,7 +191,7 @@ def list(ctx, output_format, filter_strategy, filter_mode, limit):
         if output_format == 'table':
             _display_benchmarks_table(benchmarks)
         elif output_format == 'json':
-            click.echo(json.dumps(benchmarks, indent=2))
+            _echo_json(benchmarks)
         elif output_format == 'csv':
             _display_benchmarks_csv(benchmarks)
             
@@ -167,7 +219,7 @@ def show(ctx, benchmark_id, output_format):
             return 1
         
         if output_format == 'json':
-            click.echo(json.dumps(benchmark, indent=2))
+            _echo_json(benchmark)
         elif output_format == 'summary':
             _display_benchmark_summary(benchmark)
         elif output_format == 'detailed':
@@ -224,11 +276,12 @@ def serve(ctx, port, host):
 @cli.command()
 @click.argument('objective')
 @click.option('--strategy', 
-              type=click.Choice(['auto', 'research', 'development', 'analysis', 'testing', 'optimization', 'maintenance']),
+              type=EnumChoice(['auto', 'research', 'development', 'analysis', 'testing', 'optimization', 'maintenance'],
+                              _strategy_map),
               default='auto',
               help='Execution strategy (default: auto)')
 @click.option('--mode',
-              type=click.Choice(['centralized', 'distributed', 'hierarchical', 'mesh', 'hybrid']),
+              type=EnumChoice(['centralized', 'distributed', 'hierarchical', 'mesh', 'hybrid'], _mode_map),
               default='centralized', 
               help='Coordination mode (default: centralized)')
 @click.option('--sparc-mode',
@@ -260,11 +313,11 @@ def real(ctx, objective, strategy, mode, sparc_mode, all_modes, max_agents, time
       swarm-benchmark real "Optimize performance" --mode distributed --monitor
     """
     # Create benchmark configuration
-    config = BenchmarkConfig(
-        name=name or f"real-benchmark-{strategy}-{mode}",
+    config = _build_config(
+        name=name or f"real-benchmark-{strategy.value}-{mode.value}",
         description=description or f"Real Benchmark: {objective}",
-        strategy=getattr(StrategyType, strategy.upper()),
-        mode=getattr(CoordinationMode, mode.upper()),
+        strategy=strategy,
+        mode=mode,
         max_agents=max_agents,
         timeout=timeout * 60,  # Convert to seconds
         task_timeout=task_timeout,
@@ -278,8 +331,8 @@ def real(ctx, objective, strategy, mode, sparc_mode, all_modes, max_agents, time
     if ctx.obj.get('verbose'):
         click.echo(f"Running real benchmark: {config.name}")
         click.echo(f"Objective: {objective}")
-        click.echo(f"Strategy: {strategy}")
-        click.echo(f"Mode: {mode}")
+        click.echo(f"Strategy: {strategy.value}")
+        click.echo(f"Mode: {mode.value}")
         if sparc_mode:
             click.echo(f"SPARC Mode: {sparc_mode}")
         if all_modes:
@@ -287,7 +340,7 @@ def real(ctx, objective, strategy, mode, sparc_mode, all_modes, max_agents, time
     
     # Run the real benchmark
     try:
-        result = asyncio.run(_run_real_benchmark(objective, config, sparc_mode, all_modes))
+        result = _run_async(_run_real_benchmark(objective, config, sparc_mode, all_modes))
         
         if result:
             click.echo(f"✅ Real benchmark completed successfully!")
@@ -308,8 +361,29 @@ def real(ctx, objective, strategy, mode, sparc_mode, all_modes, max_agents, time
     return 0
 
 
-async def _run_benchmark(objective: str, config: BenchmarkConfig, use_real_metrics: bool = False) -> Optional[dict]:
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed (Python 3.11+)."""
+    import asyncio
+    
+    # asyncio.Runner (3.11+) takes a loop factory, so uvloop is used for
+    # this run only instead of through the process-wide event loop policy
+    if sys.platform != "win32" and hasattr(asyncio, "Runner"):
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                return runner.run(coro)
+    
+    return asyncio.run(coro)
+
+
+async def _run_benchmark(objective: str, config: "BenchmarkConfig", use_real_metrics: bool = False) -> Optional[dict]:
     """Run a benchmark with the given objective and configuration."""
+    from swarm_benchmark.core.benchmark_engine import BenchmarkEngine
+    from swarm_benchmark.core.real_benchmark_engine import RealBenchmarkEngine
+    
     # Choose engine based on metrics flag
     if use_real_metrics:
         engine = RealBenchmarkEngine(config)
@@ -324,10 +398,12 @@ async def _run_benchmark(objective: str, config: BenchmarkConfig, use_real_metri
         return None
 
 
-async def _run_real_benchmark(objective: str, config: BenchmarkConfig, 
+async def _run_real_benchmark(objective: str, config: "BenchmarkConfig", 
                               sparc_mode: Optional[str] = None,
                               all_modes: bool = False) -> Optional[dict]:
     """Run a real benchmark with actual claude-flow execution."""
+    from swarm_benchmark.core.real_benchmark_engine import RealBenchmarkEngine
+    
     engine = RealBenchmarkEngine(config)
     
     try:
@@ -351,6 +427,25 @@ async def _run_real_benchmark(objective: str, config: BenchmarkConfig,
         engine.cleanup()
 
 
+def _echo_json(data) -> None:
+    """Print data as indented JSON, encoding with orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        # Same timestamp encoding as the JSON report writer
+        from swarm_benchmark.output.json_writer import _json_default
+        click.echo(json.dumps(data, indent=2, default=_json_default))
+        return
+    
+    # Write the encoded bytes directly, skipping click's text handling.
+    # OPT_NON_STR_KEYS keeps json.dumps' coercion of int/float/bool keys.
+    sys.stdout.flush()
+    stdout = click.get_binary_stream('stdout')
+    stdout.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    stdout.write(b"\n")
+    stdout.flush()
+
+
 def _get_recent_benchmarks(filter_strategy=None, filter_mode=None, limit=10):
     """Get recent benchmark runs."""
     # TODO: Implement database query
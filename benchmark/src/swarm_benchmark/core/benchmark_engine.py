@@ -6,7 +6,6 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 from .models import Benchmark, Task, Result, BenchmarkConfig, TaskStatus, StrategyType, CoordinationMode
-from ..strategies import create_strategy
 from ..output.json_writer import JSONWriter
 from ..output.sqlite_manager import SQLiteManager
 
@@ -58,7 +57,8 @@ class BenchmarkEngine:
         
         try:
             # Execute the task using the specified strategy
-            strategy = create_strategy(self.config.strategy.value.lower())
+            from ..strategies import create_strategy
+            strategy = create_strategy(self.config.strategy.value)
             result = await strategy.execute(main_task)
             
             # Add result to benchmark
@@ -93,9 +93,10 @@ class BenchmarkEngine:
         """Execute a batch of tasks."""
         results = []
         
+        from ..strategies import create_strategy
         for task in tasks:
             try:
-                strategy = create_strategy(task.strategy.value.lower() if hasattr(task.strategy, 'value') else task.strategy)
+                strategy = create_strategy(task.strategy.value if hasattr(task.strategy, 'value') else task.strategy)
                 result = await strategy.execute(task)
                 results.append(result)
             except Exception as e:
@@ -118,11 +119,11 @@ class BenchmarkEngine:
         
         for format_type in self.config.output_formats:
             if format_type == "json":
-                writer = JSONWriter()
+                writer = JSONWriter(pretty=self.config.verbose)
                 await writer.save_benchmark(benchmark, output_dir)
             elif format_type == "sqlite":
-                manager = SQLiteManager()
-                await manager.save_benchmark(benchmark, output_dir)
+                async with SQLiteManager() as manager:
+                    await manager.save_benchmark(benchmark, output_dir)
     
     def _result_to_dict(self, result: Result) -> Dict[str, Any]:
         """Convert result to dictionary for JSON serialization."""
@@ -185,7 +185,9 @@ class ClaudeFlowExecutor:
                  working_dir: Optional[str] = None,
                  env: Optional[Dict[str, str]] = None,
                  retry_attempts: int = 3,
-                 retry_delay: float = 2.0):
+                 retry_delay: float = 2.0,
+                 retry_backoff: float = 1.0,
+                 max_retry_delay: float = 30.0):
         """
         Initialize the executor.
         
@@ -194,15 +196,20 @@ class ClaudeFlowExecutor:
             working_dir: Working directory for execution
             env: Environment variables
             retry_attempts: Number of retry attempts for transient failures
-            retry_delay: Delay between retries in seconds
+            retry_delay: Delay before the first retry in seconds
+            retry_backoff: Factor the delay grows by after each retry
+                (1.0 keeps a fixed delay; e.g. 2.0 for exponential backoff)
+            max_retry_delay: Upper bound the delay grows to when backing off
         """
         self.claude_flow_path = claude_flow_path or self._find_claude_flow()
         self.working_dir = Path(working_dir) if working_dir else Path.cwd()
         self.env = self._prepare_environment(env)
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
+        self.retry_backoff = retry_backoff
+        self.max_retry_delay = max_retry_delay
         
-        logger.info(f"Initialized ClaudeFlowExecutor with path: {self.claude_flow_path}")
+        logger.info("Initialized ClaudeFlowExecutor with path: %s", self.claude_flow_path)
         
     def _find_claude_flow(self) -> str:
         """Find the claude-flow executable."""
@@ -270,11 +277,11 @@ class ClaudeFlowExecutor:
         Returns:
             ExecutionResult with execution details
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         timeout_occurred = False
         
         try:
-            logger.info(f"Executing command: {' '.join(command)}")
+            logger.info("Executing command: %s", ' '.join(command))
             
             # Use subprocess.run for better control
             result = subprocess.run(
@@ -286,7 +293,7 @@ class ClaudeFlowExecutor:
                 timeout=timeout
             )
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             return ExecutionResult(
                 success=result.returncode == 0,
@@ -299,8 +306,8 @@ class ClaudeFlowExecutor:
             )
             
         except subprocess.TimeoutExpired as e:
-            duration = time.time() - start_time
-            logger.error(f"Command timed out after {timeout} seconds")
+            duration = time.perf_counter() - start_time
+            logger.error("Command timed out after %s seconds", timeout)
             
             return ExecutionResult(
                 success=False,
@@ -313,8 +320,8 @@ class ClaudeFlowExecutor:
             )
             
         except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"Command execution failed: {e}")
+            duration = time.perf_counter() - start_time
+            logger.error("Command execution failed: %s", e)
             
             return ExecutionResult(
                 success=False,
@@ -331,11 +338,16 @@ class ClaudeFlowExecutor:
                       timeout: Optional[int] = None) -> ExecutionResult:
         """Execute command with retry logic."""
         last_result = None
+        delay = self.retry_delay
         
         for attempt in range(self.retry_attempts):
             if attempt > 0:
-                logger.info(f"Retry attempt {attempt + 1}/{self.retry_attempts}")
-                time.sleep(self.retry_delay)
+                logger.info("Retry attempt %s/%s in %.1fs", attempt + 1, self.retry_attempts, delay)
+                time.sleep(delay)
+                # Exponential backoff (retry_backoff > 1) gives a slow-recovering
+                # service room instead of hammering it at a fixed interval
+                if delay < self.max_retry_delay:
+                    delay = min(delay * self.retry_backoff, self.max_retry_delay)
                 
             result = self._execute_command(command, timeout)
             last_result = result
@@ -458,7 +470,7 @@ class ClaudeFlowExecutor:
                 data = json.loads(result.stdout)
                 return result, data
             except json.JSONDecodeError:
-                logger.error(f"Failed to parse memory data: {result.stdout}")
+                logger.error("Failed to parse memory data: %s", result.stdout)
                 return result, None
         
         return result, None
@@ -546,11 +558,11 @@ class ClaudeFlowExecutor:
         try:
             result = self._execute_command([self.claude_flow_path, "--version"])
             if result.success:
-                logger.info(f"Claude-flow version: {result.stdout.strip()}")
+                logger.info("Claude-flow version: %s", result.stdout.strip())
                 return True
             else:
-                logger.error(f"Version check failed: {result.stderr}")
+                logger.error("Version check failed: %s", result.stderr)
                 return False
         except Exception as e:
-            logger.error(f"Installation validation failed: {e}")
+            logger.error("Installation validation failed: %s", e)
             return False
\ No newline at end of file
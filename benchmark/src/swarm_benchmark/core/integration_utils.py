@@ -127,7 +127,7 @@ class PerformanceMonitor:
                 self.metrics.timestamps.append(time.time())
                 
             except Exception as e:
-                logger.error(f"Error in performance monitoring: {e}")
+                logger.error("Error in performance monitoring: %s", e)
                 
             time.sleep(self.interval)
 
@@ -141,7 +141,7 @@ def performance_monitoring(interval: float = 1.0):
         yield monitor
     finally:
         metrics = monitor.stop()
-        logger.info(f"Performance summary: {metrics.get_summary()}")
+        logger.info("Performance summary: %s", metrics.get_summary())
 
 
 class OutputParser:
@@ -165,6 +165,9 @@ class OutputParser:
         "swarm_id": re.compile(r"Swarm ID:\s*([^\n]+)"),
     }
     
+    # JSON-like blocks scanned for by extract_json_blocks
+    JSON_BLOCK_PATTERN = re.compile(r'\{[^{}]*\}', re.DOTALL)
+    
     @classmethod
     def parse_output(cls, output: str) -> Dict[str, Any]:
         """
@@ -264,9 +267,7 @@ class OutputParser:
         json_blocks = []
         
         # Find JSON-like blocks
-        json_pattern = re.compile(r'\{[^{}]*\}', re.DOTALL)
-        
-        for match in json_pattern.finditer(output):
+        for match in cls.JSON_BLOCK_PATTERN.finditer(output):
             try:
                 data = json.loads(match.group())
                 json_blocks.append(data)
@@ -579,7 +580,7 @@ def create_workspace(base_dir: str = None) -> Path:
     else:
         workspace = Path(tempfile.mkdtemp(prefix="claude_flow_"))
         
-    logger.info(f"Created workspace: {workspace}")
+    logger.info("Created workspace: %s", workspace)
     return workspace
 
 
@@ -601,6 +602,6 @@ def cleanup_workspace(workspace: Path, force: bool = False):
             shutil.rmtree(workspace)
         else:
             workspace.rmdir()  # Only removes if empty
-        logger.info(f"Cleaned up workspace: {workspace}")
+        logger.info("Cleaned up workspace: %s", workspace)
     except Exception as e:
-        logger.error(f"Failed to clean up workspace: {e}")
\ No newline at end of file
+        logger.error("Failed to clean up workspace: %s", e)
\ No newline at end of file
@@ -7,7 +7,6 @@ import time
 
 from .models import Benchmark, Task, Result, BenchmarkConfig, TaskStatus, StrategyType, CoordinationMode
 from .benchmark_engine import BenchmarkEngine
-from ..strategies import create_strategy
 from ..output.json_writer import JSONWriter
 from ..output.sqlite_manager import SQLiteManager
 
@@ -206,7 +205,8 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
         
         benchmark.add_task(main_task)
         
-        strategy = create_strategy(self.config.strategy.value.lower())
+        from ..strategies import create_strategy
+        strategy = create_strategy(self.config.strategy.value)
         result = await strategy.execute(main_task)
         benchmark.add_result(result)
         
@@ -214,17 +214,18 @@ class OptimizedBenchmarkEngine(BenchmarkEngine):
     
     async def _execute_task_optimized(self, task: Task) -> Result:
         """Execute a single task with optimizations."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Use strategy execution
-        strategy = create_strategy(task.strategy.value.lower() if hasattr(task.strategy, 'value') else task.strategy)
+        from ..strategies import create_strategy
+        strategy = create_strategy(task.strategy.value if hasattr(task.strategy, 'value') else task.strategy)
         
         # For demo purposes, simulate optimized execution
         # In real implementation, this would use the OptimizedExecutor
         result = await strategy.execute(task)
         
         # Add optimization metrics
-        result.execution_time = time.time() - start_time
+        result.execution_time = time.perf_counter() - start_time
         
         return result
     
@@ -140,7 +140,7 @@ class OrchestrationManager:
                 self.agent_pool.append(agent)
                 self.active_agents[agent.id] = agent
         
-        logger.info(f"Created agent pool with {len(self.agent_pool)} agents")
+        logger.info("Created agent pool with %s agents", len(self.agent_pool))
     
     async def run_benchmark_suite(self, 
                                  objectives: List[str],
@@ -228,7 +228,7 @@ class OrchestrationManager:
         # Submit all tasks
         task_ids = await self.executor.submit_batch(task_priorities)
         
-        logger.info(f"Submitted {len(task_ids)} tasks across {len(benchmarks)} benchmarks")
+        logger.info("Submitted %s tasks across %s benchmarks", len(task_ids), len(benchmarks))
         
         # Monitor and collect results
         results = {}
@@ -350,7 +350,7 @@ class OrchestrationManager:
                 self.agent_pool.append(agent)
                 self.active_agents[agent.id] = agent
             
-            logger.info(f"Added {new_agents} new agents")
+            logger.info("Added %s new agents", new_agents)
         
         # Scale down if low utilization
         elif metrics.current_cpu_usage < 20 and len(self.agent_pool) > 5:
@@ -365,7 +365,7 @@ class OrchestrationManager:
                 self.agent_pool.remove(agent)
                 del self.active_agents[agent.id]
             
-            logger.info(f"Removed {remove_count} idle agents")
+            logger.info("Removed %s idle agents", remove_count)
     
     async def _monitor_progress(self):
         """Monitor and report progress periodically."""
@@ -385,19 +385,19 @@ class OrchestrationManager:
                 # Log progress
                 if self.progress_tracker.should_report():
                     progress_info = self.progress_tracker.get_progress_report()
-                    logger.info(f"Progress: {progress_info}")
+                    logger.info("Progress: %s", progress_info)
                 
                 # Check for issues
                 if exec_metrics.tasks_failed > 10:
-                    logger.warning(f"High failure rate detected: {exec_metrics.tasks_failed} tasks failed")
+                    logger.warning("High failure rate detected: %s tasks failed", exec_metrics.tasks_failed)
                 
                 if exec_metrics.queue_wait_time > 10.0:
-                    logger.warning(f"High queue wait time: {exec_metrics.queue_wait_time:.2f}s")
+                    logger.warning("High queue wait time: %.2fs", exec_metrics.queue_wait_time)
                 
                 await asyncio.sleep(self.config.monitoring_interval)
                 
             except Exception as e:
-                logger.error(f"Progress monitoring error: {e}")
+                logger.error("Progress monitoring error: %s", e)
                 await asyncio.sleep(self.config.monitoring_interval)
     
     def _result_to_dict(self, result: Result) -> Dict[str, Any]:
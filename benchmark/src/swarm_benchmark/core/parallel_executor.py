@@ -127,11 +127,11 @@ class ResourceMonitor:
                     # Check for violations
                     if self.current_usage.cpu_percent > self.limits.max_cpu_percent:
                         self.violation_count += 1
-                        logger.warning(f"CPU usage {self.current_usage.cpu_percent:.1f}% exceeds limit {self.limits.max_cpu_percent}%")
+                        logger.warning("CPU usage %.1f%% exceeds limit %s%%", self.current_usage.cpu_percent, self.limits.max_cpu_percent)
                     
                     if self.current_usage.memory_mb > self.limits.max_memory_mb:
                         self.violation_count += 1
-                        logger.warning(f"Memory usage {self.current_usage.memory_mb:.1f}MB exceeds limit {self.limits.max_memory_mb}MB")
+                        logger.warning("Memory usage %.1fMB exceeds limit %sMB", self.current_usage.memory_mb, self.limits.max_memory_mb)
                     
                     # Update peak values
                     self.current_usage.peak_memory_mb = max(
@@ -142,7 +142,7 @@ class ResourceMonitor:
                 time.sleep(self.limits.monitoring_interval)
                 
             except Exception as e:
-                logger.error(f"Resource monitoring error: {e}")
+                logger.error("Resource monitoring error: %s", e)
                 time.sleep(self.limits.monitoring_interval)
     
     def check_resources(self) -> bool:
@@ -196,9 +196,12 @@ class ParallelExecutor:
         self.running = False
         self.shutdown_event = asyncio.Event()
         self._lock = asyncio.Lock()
+        # Notified (under _lock) whenever a task completes or fails, so
+        # waiters wake immediately instead of polling
+        self._task_done = asyncio.Condition(self._lock)
         
         # Task execution tracking
-        self.task_start_times: Dict[str, float] = {}
+        self.task_start_times: Dict[str, float] = {}  # time.perf_counter() values
         self.task_results: Queue = Queue()
         
         # Initialize executors based on mode
@@ -240,7 +243,7 @@ class ParallelExecutor:
         # Store workers for cleanup
         self._workers = workers
         
-        logger.info(f"Started ParallelExecutor with {self.limits.max_concurrent_tasks} workers")
+        logger.info("Started ParallelExecutor with %s workers", self.limits.max_concurrent_tasks)
     
     async def stop(self):
         """Stop the parallel executor."""
@@ -283,7 +286,7 @@ class ParallelExecutor:
         async with self._lock:
             self.metrics.tasks_queued += 1
         
-        logger.debug(f"Submitted task {task.id} with priority {priority}")
+        logger.debug("Submitted task %s with priority %s", task.id, priority)
         return task.id
     
     async def submit_batch(self, tasks: List[Tuple[Task, int]]) -> List[str]:
@@ -296,30 +299,25 @@ class ParallelExecutor:
     
     async def get_result(self, task_id: str, timeout: Optional[float] = None) -> Optional[Result]:
         """Get result for a specific task."""
-        start_time = time.time()
+        finished = await self._wait_until(
+            lambda: task_id in self.completed_tasks or task_id in self.failed_tasks,
+            timeout
+        )
+        if not finished:
+            return None
         
-        while True:
-            # Check completed tasks
-            if task_id in self.completed_tasks:
-                return self.completed_tasks[task_id]
-            
-            # Check failed tasks
-            if task_id in self.failed_tasks:
-                task, error = self.failed_tasks[task_id]
-                # Create error result
-                return Result(
-                    task_id=task_id,
-                    status=ResultStatus.ERROR,
-                    errors=[str(error)],
-                    completed_at=datetime.now()
-                )
-            
-            # Check timeout
-            if timeout and (time.time() - start_time) > timeout:
-                return None
-            
-            # Wait a bit before checking again
-            await asyncio.sleep(0.1)
+        # Check completed tasks
+        if task_id in self.completed_tasks:
+            return self.completed_tasks[task_id]
+        
+        # Failed task: create error result
+        task, error = self.failed_tasks[task_id]
+        return Result(
+            task_id=task_id,
+            status=ResultStatus.ERROR,
+            errors=[str(error)],
+            completed_at=datetime.now()
+        )
     
     async def get_all_results(self) -> Dict[str, Result]:
         """Get all completed results."""
@@ -328,22 +326,34 @@ class ParallelExecutor:
     
     async def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         """Wait for all tasks to complete."""
-        start_time = time.time()
-        
-        while True:
-            async with self._lock:
-                if (self.metrics.tasks_queued == 
-                    self.metrics.tasks_completed + self.metrics.tasks_failed):
-                    return True
-            
-            if timeout and (time.time() - start_time) > timeout:
+        return await self._wait_until(
+            lambda: (self.metrics.tasks_queued ==
+                     self.metrics.tasks_completed + self.metrics.tasks_failed),
+            timeout
+        )
+    
+    async def _wait_until(self, predicate: Callable[[], bool], timeout: Optional[float]) -> bool:
+        """Wait until ``predicate`` holds, re-checking it as tasks finish.
+        
+        Returns False if ``timeout`` seconds pass first. A ``timeout`` that
+        is not positive means wait indefinitely, as with None.
+        """
+        if timeout is not None and timeout <= 0:
+            timeout = None
+        
+        async with self._task_done:
+            # Already satisfied: skip setting up the timed wait
+            if predicate():
+                return True
+            try:
+                await asyncio.wait_for(self._task_done.wait_for(predicate), timeout)
+            except asyncio.TimeoutError:
                 return False
-            
-            await asyncio.sleep(0.5)
+        return True
     
     async def _worker(self, worker_id: str):
         """Worker coroutine that processes tasks from the queue."""
-        logger.debug(f"Worker {worker_id} started")
+        logger.debug("Worker %s started", worker_id)
         
         while self.running:
             try:
@@ -372,13 +382,13 @@ class ParallelExecutor:
                     continue
                 
                 # Execute task
-                logger.debug(f"Worker {worker_id} executing task {task.id}")
-                start_time = time.time()
+                logger.debug("Worker %s executing task %s", worker_id, task.id)
+                start_time = time.perf_counter()
                 self.task_start_times[task.id] = start_time
                 
                 try:
                     result = await self._execute_task(task)
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
                     
                     # Update result metrics
                     result.performance_metrics.execution_time = execution_time
@@ -393,14 +403,16 @@ class ParallelExecutor:
                         self.metrics.average_execution_time = (
                             self.metrics.total_execution_time / self.metrics.tasks_completed
                         )
+                        self._task_done.notify_all()
                     
-                    logger.info(f"Task {task.id} completed in {execution_time:.2f}s")
+                    logger.info("Task %s completed in %.2fs", task.id, execution_time)
                     
                 except Exception as e:
-                    logger.error(f"Task {task.id} failed: {e}")
+                    logger.error("Task %s failed: %s", task.id, e)
                     async with self._lock:
                         self.failed_tasks[task.id] = (task, e)
                         self.metrics.tasks_failed += 1
+                        self._task_done.notify_all()
                 
                 finally:
                     async with self._lock:
@@ -409,10 +421,10 @@ class ParallelExecutor:
                         del self.task_start_times[task.id]
                 
             except Exception as e:
-                logger.error(f"Worker {worker_id} error: {e}")
+                logger.error("Worker %s error: %s", worker_id, e)
                 await asyncio.sleep(1)
         
-        logger.debug(f"Worker {worker_id} stopped")
+        logger.debug("Worker %s stopped", worker_id)
     
     def _get_task_with_timeout(self, timeout: float) -> Optional[TaskPriority]:
         """Get task from queue with timeout."""
@@ -451,7 +463,7 @@ class ParallelExecutor:
         # Import strategy dynamically
         from ..strategies import create_strategy
         
-        strategy = create_strategy(task.strategy.value.lower())
+        strategy = create_strategy(task.strategy.value)
         result = await strategy.execute(task)
         return result
     
@@ -463,7 +475,7 @@ class ParallelExecutor:
         from ..strategies import create_strategy
         
         def run_task():
-            strategy = create_strategy(task.strategy.value.lower())
+            strategy = create_strategy(task.strategy.value)
             # Create new event loop for thread
             thread_loop = asyncio.new_event_loop()
             asyncio.set_event_loop(thread_loop)
@@ -514,7 +526,7 @@ class ParallelExecutor:
                 await asyncio.sleep(1.0)
                 
             except Exception as e:
-                logger.error(f"Metrics update error: {e}")
+                logger.error("Metrics update error: %s", e)
                 await asyncio.sleep(1.0)
     
     def get_metrics(self) -> ExecutionMetrics:
@@ -537,7 +549,7 @@ def _execute_task_in_process(task: Task) -> Result:
     asyncio.set_event_loop(loop)
     
     try:
-        strategy = create_strategy(task.strategy.value.lower())
+        strategy = create_strategy(task.strategy.value)
         result = loop.run_until_complete(strategy.execute(task))
         return result
     finally:
@@ -585,7 +597,7 @@ class BatchExecutor:
             # Submit all tasks
             task_ids = await self.executor.submit_batch(tasks)
             
-            logger.info(f"Submitted {len(tasks)} benchmark tasks")
+            logger.info("Submitted %s benchmark tasks", len(tasks))
             
             # Wait for completion
             completed = await self.executor.wait_for_completion(
@@ -625,7 +637,7 @@ class BatchExecutor:
         suite_results = {}
         
         for suite_name, suite_objectives in suite_config.items():
-            logger.info(f"Running benchmark suite: {suite_name}")
+            logger.info("Running benchmark suite: %s", suite_name)
             
             results = await self.run_benchmarks(
                 objectives=suite_objectives.get('objectives', []),
@@ -6,6 +6,7 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import subprocess
 import json
+import re
 
 from .models import (
     Benchmark, Task, Result, BenchmarkConfig, TaskStatus, 
@@ -15,10 +16,12 @@ from .models import (
 from .benchmark_engine import BenchmarkEngine
 from ..metrics.metrics_aggregator import MetricsAggregator
 from ..metrics.process_tracker import ProcessTracker, ProcessExecutionResult
-from ..strategies import create_strategy
 from ..output.json_writer import JSONWriter
 from ..output.sqlite_manager import SQLiteManager
 
+# Fenced ```json blocks in claude-flow stdout
+_JSON_FENCE_PATTERN = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+
 
 class RealBenchmarkEngine(BenchmarkEngine):
     """Benchmark engine with real metrics collection for claude-flow."""
@@ -229,9 +232,7 @@ class RealBenchmarkEngine(BenchmarkEngine):
         # Try to extract JSON data if present
         try:
             # Look for JSON blocks in output
-            import re
-            json_pattern = r'```json\n(.*?)\n```'
-            json_matches = re.findall(json_pattern, stdout, re.DOTALL)
+            json_matches = _JSON_FENCE_PATTERN.findall(stdout)
             if json_matches:
                 output["json_data"] = []
                 for match in json_matches:
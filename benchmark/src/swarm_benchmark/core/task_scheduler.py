@@ -373,7 +373,7 @@ class TaskScheduler:
                 self.agent_workload[original_agent_id] -= 1
                 self.agent_workload[idle_agent.id] += 1
                 
-                logger.info(f"Agent {idle_agent.id} stole task {task.id} from agent {original_agent_id}")
+                logger.info("Agent %s stole task %s from agent %s", idle_agent.id, task.id, original_agent_id)
                 return task
         
         return None
@@ -7,18 +7,20 @@ from .hierarchical_mode import HierarchicalMode
 from .mesh_mode import MeshMode
 from .hybrid_mode import HybridMode
 
+# Mode registry, keyed by lowercase name
+MODE_REGISTRY = {
+    "centralized": CentralizedMode,
+    "distributed": DistributedMode,
+    "hierarchical": HierarchicalMode,
+    "mesh": MeshMode,
+    "hybrid": HybridMode,
+}
+
 # Mode factory
 def create_coordination_mode(mode_name: str) -> BaseCoordinationMode:
     """Create a coordination mode instance by name."""
-    modes = {
-        "centralized": CentralizedMode,
-        "distributed": DistributedMode,
-        "hierarchical": HierarchicalMode,
-        "mesh": MeshMode,
-        "hybrid": HybridMode,
-    }
-    
-    mode_class = modes.get(mode_name.lower())
+    # Names usually arrive lowercase (enum values); only fold case on a miss
+    mode_class = MODE_REGISTRY.get(mode_name) or MODE_REGISTRY.get(mode_name.lower())
     if not mode_class:
         raise ValueError(f"Unknown coordination mode: {mode_name}")
     
@@ -26,7 +28,7 @@ def create_coordination_mode(mode_name: str) -> BaseCoordinationMode:
 
 def get_available_modes() -> list[str]:
     """Get list of available coordination mode names."""
-    return ["centralized", "distributed", "hierarchical", "mesh", "hybrid"]
+    return list(MODE_REGISTRY.keys())
 
 __all__ = [
     "BaseCoordinationMode",
@@ -35,6 +37,7 @@ __all__ = [
     "HierarchicalMode",
     "MeshMode",
     "HybridMode",
+    "MODE_REGISTRY",
     "create_coordination_mode",
     "get_available_modes",
 ]
\ No newline at end of file
@@ -178,7 +178,7 @@ class CentralizedMode(BaseCoordinationMode):
         
         try:
             # Get strategy for task execution
-            strategy = create_strategy(task.strategy.value.lower())
+            strategy = create_strategy(task.strategy.value)
             result = await strategy.execute(task)
             
             # Add coordination metrics
@@ -262,7 +262,7 @@ class DistributedMode(BaseCoordinationMode):
         
         try:
             # Get strategy for task execution
-            strategy = create_strategy(task.strategy.value.lower())
+            strategy = create_strategy(task.strategy.value)
             result = await strategy.execute(task)
             
             # Add distributed coordination metrics
@@ -186,7 +186,7 @@ class HierarchicalMode(BaseCoordinationMode):
         
         try:
             # Get strategy for task execution
-            strategy = create_strategy(task.strategy.value.lower())
+            strategy = create_strategy(task.strategy.value)
             result = await strategy.execute(task)
             
             # Add hierarchical coordination metrics
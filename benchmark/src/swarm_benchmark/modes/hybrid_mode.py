@@ -114,7 +114,7 @@ class HybridMode(BaseCoordinationMode):
         # Decision factors
         task_complexity = self._estimate_task_complexity(task)
         agent_count = len(agents)
-        task_type = task.strategy.value.lower()
+        task_type = task.strategy.value
         
         # Strategy selection heuristics
         if agent_count <= 2:
@@ -167,7 +167,7 @@ class HybridMode(BaseCoordinationMode):
             "optimization": 0.9,
             "maintenance": 0.3
         }
-        complexity_factors.append(strategy_complexity.get(task.strategy.value.lower(), 0.5))
+        complexity_factors.append(strategy_complexity.get(task.strategy.value, 0.5))
         
         # Parameters complexity
         param_factor = min(len(task.parameters) / 10.0, 1.0)
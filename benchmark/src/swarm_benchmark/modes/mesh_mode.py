@@ -245,7 +245,7 @@ class MeshMode(BaseCoordinationMode):
         
         try:
             # Get strategy for task execution
-            strategy = create_strategy(task.strategy.value.lower())
+            strategy = create_strategy(task.strategy.value)
             result = await strategy.execute(task)
             
             # Add mesh coordination metrics
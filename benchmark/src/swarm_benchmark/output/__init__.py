@@ -1,6 +1,12 @@
 """Output modules for benchmark results."""
 
+# Import cycle: json_writer imports core.models, which runs core/__init__,
+# which imports the engines, which import JSONWriter from this package. If
+# output is imported first, the engines would see json_writer only partly
+# initialized. Loading core up front lets the engines import a complete
+# output package instead.
+from .. import core as _core  # noqa: F401
 from .json_writer import JSONWriter
 from .sqlite_manager import SQLiteManager
 
-__all__ = ["JSONWriter", "SQLiteManager"]
\ No newline at end of file
+__all__ = ["JSONWriter", "SQLiteManager"]
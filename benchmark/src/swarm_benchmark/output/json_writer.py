@@ -1,19 +1,67 @@
 """JSON output writer for benchmark results."""
 
+import asyncio
+import functools
 import json
+import operator
+from dataclasses import fields
 from pathlib import Path
-from typing import Dict, Any
-from datetime import datetime
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Tuple
+from datetime import date, datetime, time
 
-from ..core.models import Benchmark, Result
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..core.models import (
+    Benchmark, BenchmarkConfig, BenchmarkMetrics, Result,
+    PerformanceMetrics, QualityMetrics, ResourceUsage,
+    TaskStatus, ResultStatus, StrategyType, CoordinationMode
+)
+
+# Userspace buffer for the streamed writer; amortizes the many small
+# per-field/per-record writes into few write() syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Separator between top-level array items, keyed by the pretty flag
+_ITEM_SEPARATOR = {False: b",", True: b",\n    "}
+
+# Plain dict lookup instead of the Enum.value descriptor on every record
+_ENUM_VALUES = {
+    member: member.value
+    for enum_cls in (TaskStatus, ResultStatus, StrategyType, CoordinationMode)
+    for member in enum_cls
+}
+
+
+def _field_getter(cls) -> Tuple[Tuple[str, ...], Callable[[Any], tuple]]:
+    """Return a dataclass's field names and an attrgetter fetching them all."""
+    names = tuple(f.name for f in fields(cls))
+    return names, operator.attrgetter(*names)
+
+
+# Field tables are derived from the model dataclasses once at import, so each
+# flat converter is a single C-level attribute fetch plus dict(zip(...)) and
+# stays in sync when a model gains a field
+_CONFIG_FIELDS, _get_config = _field_getter(BenchmarkConfig)
+_METRICS_FIELDS, _get_metrics = _field_getter(BenchmarkMetrics)
+_PERF_FIELDS, _get_perf = _field_getter(PerformanceMetrics)
+_QUALITY_FIELDS, _get_quality = _field_getter(QualityMetrics)
+_RESOURCE_FIELDS, _get_resource = _field_getter(ResourceUsage)
 
 
 class JSONWriter:
     """Writes benchmark results to JSON files."""
     
-    def __init__(self):
-        """Initialize the JSON writer."""
-        pass
+    def __init__(self, pretty: bool = False):
+        """Initialize the JSON writer.
+        
+        Args:
+            pretty: Indent the output for human reading. Compact output is
+                roughly half the size and faster to encode.
+        """
+        self.pretty = pretty
     
     async def save_benchmark(self, benchmark: Benchmark, output_dir: Path) -> Path:
         """Save benchmark to JSON file.
@@ -27,53 +75,50 @@ class JSONWriter:
         """
         output_file = output_dir / f"{benchmark.name}_{benchmark.id}.json"
         
-        benchmark_data = self._benchmark_to_dict(benchmark)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(benchmark_data, f, indent=2, default=self._json_serializer)
+        # Encoding and file I/O run in a worker thread so large benchmarks
+        # don't stall the event loop while they are flushed to disk.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_file, benchmark, output_file)
         
         return output_file
     
-    def _benchmark_to_dict(self, benchmark: Benchmark) -> Dict[str, Any]:
-        """Convert benchmark to dictionary."""
-        return {
-            "id": benchmark.id,
-            "name": benchmark.name,
-            "description": benchmark.description,
-            "status": benchmark.status.value,
-            "config": self._config_to_dict(benchmark.config),
-            "tasks": [self._task_to_dict(task) for task in benchmark.tasks],
-            "results": [self._result_to_dict(result) for result in benchmark.results],
-            "metrics": self._metrics_to_dict(benchmark.metrics),
-            "created_at": benchmark.created_at.isoformat(),
-            "started_at": benchmark.started_at.isoformat() if benchmark.started_at else None,
-            "completed_at": benchmark.completed_at.isoformat() if benchmark.completed_at else None,
-            "duration": benchmark.duration(),
-            "error_log": benchmark.error_log,
-            "metadata": benchmark.metadata
-        }
+    def _write_file(self, benchmark: Benchmark, output_file: Path) -> None:
+        """Write benchmark to output_file (blocking)."""
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as fp:
+            self._write_benchmark(benchmark, fp)
+    
+    def _write_benchmark(self, benchmark: Benchmark, fp: BinaryIO) -> None:
+        """Stream benchmark to an open binary file.
+        
+        Top-level fields are written one at a time and the tasks/results
+        arrays are emitted record by record, so the full document is never
+        held in memory as a nested dict.
+        """
+        write = fp.write
+        pretty = self.pretty
+        write(b"{")
+        _write_field(write, "id", benchmark.id, pretty, first=True)
+        _write_field(write, "name", benchmark.name, pretty)
+        _write_field(write, "description", benchmark.description, pretty)
+        _write_field(write, "status", _ENUM_VALUES[benchmark.status], pretty)
+        _write_field(write, "config", self._config_to_dict(benchmark.config), pretty)
+        _write_array(write, "tasks", _iter_encoded(benchmark.tasks, self._task_to_dict, pretty), pretty)
+        _write_array(write, "results", _iter_encoded(benchmark.results, self._result_to_dict, pretty), pretty)
+        _write_field(write, "metrics", self._metrics_to_dict(benchmark.metrics), pretty)
+        _write_field(write, "created_at", benchmark.created_at, pretty)
+        _write_field(write, "started_at", benchmark.started_at, pretty)
+        _write_field(write, "completed_at", benchmark.completed_at, pretty)
+        _write_field(write, "duration", benchmark.duration(), pretty)
+        _write_field(write, "error_log", benchmark.error_log, pretty)
+        _write_field(write, "metadata", benchmark.metadata, pretty)
+        write(b"\n}" if pretty else b"}")
     
     def _config_to_dict(self, config) -> Dict[str, Any]:
         """Convert config to dictionary."""
-        return {
-            "name": config.name,
-            "description": config.description,
-            "strategy": config.strategy.value,
-            "mode": config.mode.value,
-            "max_agents": config.max_agents,
-            "max_tasks": config.max_tasks,
-            "timeout": config.timeout,
-            "task_timeout": config.task_timeout,
-            "max_retries": config.max_retries,
-            "parallel": config.parallel,
-            "background": config.background,
-            "monitoring": config.monitoring,
-            "quality_threshold": config.quality_threshold,
-            "resource_limits": config.resource_limits,
-            "output_formats": config.output_formats,
-            "output_directory": config.output_directory,
-            "verbose": config.verbose
-        }
+        data = dict(zip(_CONFIG_FIELDS, _get_config(config)))
+        data["strategy"] = _ENUM_VALUES[config.strategy]
+        data["mode"] = _ENUM_VALUES[config.mode]
+        return data
     
     def _task_to_dict(self, task) -> Dict[str, Any]:
         """Convert task to dictionary."""
@@ -81,16 +126,16 @@ class JSONWriter:
             "id": task.id,
             "objective": task.objective,
             "description": task.description,
-            "strategy": task.strategy.value,
-            "mode": task.mode.value,
+            "strategy": _ENUM_VALUES[task.strategy],
+            "mode": _ENUM_VALUES[task.mode],
             "parameters": task.parameters,
             "timeout": task.timeout,
             "max_retries": task.max_retries,
             "priority": task.priority,
-            "status": task.status.value,
-            "created_at": task.created_at.isoformat(),
-            "started_at": task.started_at.isoformat() if task.started_at else None,
-            "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+            "status": _ENUM_VALUES[task.status],
+            "created_at": task.created_at,
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
             "duration": task.duration(),
             "assigned_agents": task.assigned_agents,
             "parent_task_id": task.parent_task_id,
@@ -104,68 +149,95 @@ class JSONWriter:
             "id": result.id,
             "task_id": result.task_id,
             "agent_id": result.agent_id,
-            "status": result.status.value,
+            "status": _ENUM_VALUES[result.status],
             "output": result.output,
             "errors": result.errors,
             "warnings": result.warnings,
-            "performance_metrics": {
-                "execution_time": result.performance_metrics.execution_time,
-                "queue_time": result.performance_metrics.queue_time,
-                "throughput": result.performance_metrics.throughput,
-                "success_rate": result.performance_metrics.success_rate,
-                "error_rate": result.performance_metrics.error_rate,
-                "retry_count": result.performance_metrics.retry_count,
-                "coordination_overhead": result.performance_metrics.coordination_overhead,
-                "communication_latency": result.performance_metrics.communication_latency
-            },
-            "quality_metrics": {
-                "accuracy_score": result.quality_metrics.accuracy_score,
-                "completeness_score": result.quality_metrics.completeness_score,
-                "consistency_score": result.quality_metrics.consistency_score,
-                "relevance_score": result.quality_metrics.relevance_score,
-                "overall_quality": result.quality_metrics.overall_quality,
-                "review_score": result.quality_metrics.review_score,
-                "automated_score": result.quality_metrics.automated_score
-            },
-            "resource_usage": {
-                "cpu_percent": result.resource_usage.cpu_percent,
-                "memory_mb": result.resource_usage.memory_mb,
-                "network_bytes_sent": result.resource_usage.network_bytes_sent,
-                "network_bytes_recv": result.resource_usage.network_bytes_recv,
-                "disk_bytes_read": result.resource_usage.disk_bytes_read,
-                "disk_bytes_write": result.resource_usage.disk_bytes_write,
-                "peak_memory_mb": result.resource_usage.peak_memory_mb,
-                "average_cpu_percent": result.resource_usage.average_cpu_percent
-            },
+            "performance_metrics": dict(zip(_PERF_FIELDS, _get_perf(result.performance_metrics))),
+            "quality_metrics": dict(zip(_QUALITY_FIELDS, _get_quality(result.quality_metrics))),
+            "resource_usage": dict(zip(_RESOURCE_FIELDS, _get_resource(result.resource_usage))),
             "execution_details": result.execution_details,
-            "created_at": result.created_at.isoformat(),
-            "started_at": result.started_at.isoformat() if result.started_at else None,
-            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
+            "created_at": result.created_at,
+            "started_at": result.started_at,
+            "completed_at": result.completed_at,
             "duration": result.duration()
         }
     
     def _metrics_to_dict(self, metrics) -> Dict[str, Any]:
         """Convert metrics to dictionary."""
-        return {
-            "total_tasks": metrics.total_tasks,
-            "completed_tasks": metrics.completed_tasks,
-            "failed_tasks": metrics.failed_tasks,
-            "total_agents": metrics.total_agents,
-            "active_agents": metrics.active_agents,
-            "average_execution_time": metrics.average_execution_time,
-            "total_execution_time": metrics.total_execution_time,
-            "success_rate": metrics.success_rate,
-            "throughput": metrics.throughput,
-            "resource_efficiency": metrics.resource_efficiency,
-            "coordination_efficiency": metrics.coordination_efficiency,
-            "quality_score": metrics.quality_score,
-            "peak_memory_usage": metrics.peak_memory_usage,
-            "total_cpu_time": metrics.total_cpu_time,
-            "network_overhead": metrics.network_overhead
-        }
-    
-    def _json_serializer(self, obj):
-        """JSON serializer for datetime and other objects."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
\ No newline at end of file
+        return dict(zip(_METRICS_FIELDS, _get_metrics(metrics)))
+
+
+def _json_default(obj):
+    """Fallback serializer for the stdlib encoder (orjson handles these natively)."""
+    # Exact-type check first: timestamps are the only common fallback type
+    if type(obj) is datetime or isinstance(obj, (date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+# json.dumps() builds a new JSONEncoder whenever non-default options are
+# given, so the stdlib fallback reuses one encoder per layout
+_STDLIB_ENCODERS = {
+    False: json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_json_default),
+    True: json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default),
+}
+
+
+def _dumps(obj: Any, pretty: bool) -> bytes:
+    """Encode a value as JSON bytes, indented when pretty."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return _STDLIB_ENCODERS[pretty].encode(obj).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _member_prefix(key: str, pretty: bool, first: bool) -> bytes:
+    """Return the separator and encoded key that precede a top-level value."""
+    if pretty:
+        return (b"\n  " if first else b",\n  ") + _dumps(key, True) + b": "
+    return (b"" if first else b",") + _dumps(key, False) + b":"
+
+
+def _write_field(write: Callable[[bytes], Any], key: str, value: Any,
+                 pretty: bool, first: bool = False) -> None:
+    """Write one top-level ``"key": value`` member."""
+    write(_member_prefix(key, pretty, first))
+    if pretty:
+        # JSON strings never contain raw newlines, so re-indenting is a plain replace
+        write(_dumps(value, True).replace(b"\n", b"\n  "))
+    else:
+        write(_dumps(value, False))
+
+
+def _encode_item(item: Dict[str, Any], pretty: bool) -> bytes:
+    """Encode one array item, indented to its position when pretty."""
+    if pretty:
+        # JSON strings never contain raw newlines, so re-indenting is a plain replace
+        return _dumps(item, True).replace(b"\n", b"\n    ")
+    return _dumps(item, False)
+
+
+def _iter_encoded(items: Iterable[Any], to_dict: Callable[[Any], Dict[str, Any]],
+                  pretty: bool) -> Iterable[bytes]:
+    """Lazily encode items one at a time."""
+    return (_encode_item(to_dict(item), pretty) for item in items)
+
+
+def _write_array(write: Callable[[bytes], Any], key: str, encoded: Iterable[bytes],
+                 pretty: bool) -> None:
+    """Write one top-level array member from already-encoded items."""
+    write(_member_prefix(key, pretty, False))
+    start = b"[\n    " if pretty else b"["
+    prefix = start
+    for chunk in encoded:
+        write(prefix)
+        write(chunk)
+        prefix = _ITEM_SEPARATOR[pretty]
+    if prefix is start:
+        write(b"[]")
+    else:
+        write(b"\n  ]" if pretty else b"]")
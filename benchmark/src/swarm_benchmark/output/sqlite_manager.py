@@ -1,20 +1,307 @@
 """SQLite database manager for benchmark results."""
 
 import aiosqlite
+import asyncio
 import json
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Final, List, Optional, Set, Tuple
+from datetime import datetime, timedelta, timezone
 
-from ..core.models import Benchmark, Task, Result, BenchmarkMetrics
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..core.models import (
+    Benchmark, BenchmarkConfig, BenchmarkMetrics, Result, Task,
+    PerformanceMetrics, QualityMetrics, ResourceUsage,
+)
+# Share the writer's dataclass field tables so both outputs stay in sync
+from .json_writer import (
+    _ENUM_VALUES,
+    _CONFIG_FIELDS, _get_config,
+    _METRICS_FIELDS, _get_metrics,
+    _PERF_FIELDS, _get_perf,
+    _QUALITY_FIELDS, _get_quality,
+    _RESOURCE_FIELDS, _get_resource,
+)
+
+# Connection tuning for a write-heavy results sink: WAL with NORMAL sync
+# avoids an fsync per commit, and a larger page cache/mmap keeps the
+# working set in memory
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Fixed statements are built once so every call reuses the same string
+# objects and hits SQLite's prepared-statement cache
+_SQL_INSERT_BENCHMARK: Final[str] = """
+    INSERT OR REPLACE INTO benchmarks (
+        id, name, description, status, strategy, mode, config, metrics,
+        created_at, started_at, completed_at, duration, error_log, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_BENCHMARK: Final[str] = "SELECT * FROM benchmarks WHERE id = ?"
+
+# Stored in PRAGMA user_version. Version 0 databases hold ISO-8601 text
+# timestamps and are rebuilt with INTEGER columns when first opened.
+_SCHEMA_VERSION: Final[int] = 1
+
+# Table definitions in creation order, formatted with the table name so the
+# version 0 migration can build a replacement table alongside the old one
+_TABLE_DDL: Final[Dict[str, str]] = {
+    "benchmarks": """
+        CREATE TABLE IF NOT EXISTS {table} (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            description TEXT,
+            status TEXT NOT NULL,
+            strategy TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            config TEXT,
+            metrics TEXT,
+            created_at INTEGER NOT NULL,
+            started_at INTEGER,
+            completed_at INTEGER,
+            duration REAL,
+            error_log TEXT,
+            metadata TEXT
+        )
+    """,
+    "tasks": """
+        CREATE TABLE IF NOT EXISTS {table} (
+            id TEXT PRIMARY KEY,
+            benchmark_id TEXT NOT NULL,
+            objective TEXT NOT NULL,
+            description TEXT,
+            strategy TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            parameters TEXT,
+            timeout INTEGER,
+            max_retries INTEGER,
+            priority INTEGER,
+            status TEXT NOT NULL,
+            created_at INTEGER NOT NULL,
+            started_at INTEGER,
+            completed_at INTEGER,
+            duration REAL,
+            assigned_agents TEXT,
+            parent_task_id TEXT,
+            subtasks TEXT,
+            dependencies TEXT,
+            FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id)
+        )
+    """,
+    "results": """
+        CREATE TABLE IF NOT EXISTS {table} (
+            id TEXT PRIMARY KEY,
+            benchmark_id TEXT NOT NULL,
+            task_id TEXT NOT NULL,
+            agent_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            output TEXT,
+            errors TEXT,
+            warnings TEXT,
+            performance_metrics TEXT,
+            quality_metrics TEXT,
+            resource_usage TEXT,
+            execution_details TEXT,
+            created_at INTEGER NOT NULL,
+            started_at INTEGER,
+            completed_at INTEGER,
+            duration REAL,
+            FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id),
+            FOREIGN KEY (task_id) REFERENCES tasks (id)
+        )
+    """,
+}
+
+_BENCHMARK_COLUMNS: Final[tuple] = (
+    "id", "name", "description", "status", "strategy", "mode", "config", "metrics",
+    "created_at", "started_at", "completed_at", "duration", "error_log", "metadata",
+)
+
+_TASK_COLUMNS: Final[tuple] = (
+    "id", "benchmark_id", "objective", "description", "strategy", "mode", "parameters",
+    "timeout", "max_retries", "priority", "status", "created_at", "started_at",
+    "completed_at", "duration", "assigned_agents", "parent_task_id", "subtasks", "dependencies",
+)
+
+_RESULT_COLUMNS: Final[tuple] = (
+    "id", "benchmark_id", "task_id", "agent_id", "status", "output", "errors", "warnings",
+    "performance_metrics", "quality_metrics", "resource_usage", "execution_details",
+    "created_at", "started_at", "completed_at", "duration",
+)
+
+_TABLE_COLUMNS: Final[Dict[str, tuple]] = {
+    "benchmarks": _BENCHMARK_COLUMNS,
+    "tasks": _TASK_COLUMNS,
+    "results": _RESULT_COLUMNS,
+}
+
+# Field table and getter per JSON-column dataclass, used by _to_dict
+_SERIALIZERS: Dict[type, Tuple[Tuple[str, ...], Callable[[Any], tuple]]] = {
+    BenchmarkConfig: (_CONFIG_FIELDS, _get_config),
+    BenchmarkMetrics: (_METRICS_FIELDS, _get_metrics),
+    PerformanceMetrics: (_PERF_FIELDS, _get_perf),
+    QualityMetrics: (_QUALITY_FIELDS, _get_quality),
+    ResourceUsage: (_RESOURCE_FIELDS, _get_resource),
+}
+
+# Stored as INTEGER microseconds since a naive 1970 epoch and decoded at the
+# query edge. Naive datetimes never pass through local time, so they
+# round-trip exactly regardless of the timezone or DST transitions.
+_TIMESTAMP_COLUMNS: Final[tuple] = ("created_at", "started_at", "completed_at")
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+# Bulk rows are written as multi-VALUES upserts; each statement must stay
+# under SQLite's bound-parameter limit (999 before 3.32)
+_MAX_VARIABLES: Final[int] = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+_UPSERT_CHUNK_ROWS: Final[int] = 500
+
+
+@lru_cache(maxsize=32)
+def _upsert_sql(table: str, columns: tuple, rows: int) -> str:
+    """Build a multi-row INSERT ... ON CONFLICT(id) DO UPDATE statement."""
+    placeholders = "(" + ", ".join("?" * len(columns)) + ")"
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != "id")
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        + ", ".join([placeholders] * rows)
+        + f" ON CONFLICT(id) DO UPDATE SET {updates}"
+    )
+
+
+async def _upsert_rows(db: aiosqlite.Connection, table: str, columns: tuple, rows: List[tuple]) -> None:
+    """Write rows to ``table`` in chunks of multi-VALUES upserts."""
+    chunk_rows = min(_UPSERT_CHUNK_ROWS, _MAX_VARIABLES // len(columns))
+    for start in range(0, len(rows), chunk_rows):
+        chunk = rows[start:start + chunk_rows]
+        await db.execute(
+            _upsert_sql(table, columns, len(chunk)),
+            [value for row in chunk for value in row],
+        )
+
+
+def _dumps(obj: Any) -> str:
+    """Encode a JSON column value, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _to_micros(value: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to the integer stored in timestamp columns.
+    
+    Aware datetimes are stored as their naive UTC equivalent.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: Any) -> Any:
+    """Convert a stored timestamp back to an ISO-8601 string (None passes through)."""
+    if isinstance(value, int):
+        return (_EPOCH + timedelta(microseconds=value)).isoformat()
+    return value
+
+
+def _iso_to_micros(value: Any) -> Any:
+    """SQL function used by the version 0 migration to convert ISO text timestamps."""
+    if isinstance(value, str):
+        return _to_micros(datetime.fromisoformat(value))
+    return value
+
+
+def _decode_row(row: aiosqlite.Row) -> Dict[str, Any]:
+    """Convert a result row to a dict with ISO-8601 timestamps."""
+    data = dict(row)
+    for key in _TIMESTAMP_COLUMNS:
+        if key in data:
+            data[key] = _from_micros(data[key])
+    return data
+
+
+if orjson is not None and hasattr(orjson, "Fragment"):
+    _embed_json = orjson.Fragment
+elif orjson is not None:
+    _embed_json = orjson.loads
+else:
+    _embed_json = json.loads
+
+# Per-column converters applied when benchmark rows are re-encoded as JSON
+_JSON_COLUMN_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "config": _embed_json,
+    "metrics": _embed_json,
+    "error_log": _embed_json,
+    "metadata": _embed_json,
+    **{column: _from_micros for column in _TIMESTAMP_COLUMNS},
+}
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Flatten a config or metrics dataclass via its cached field table."""
+    keys, get = _SERIALIZERS[type(obj)]
+    return dict(zip(keys, get(obj)))
+
+
+def _enum_value(obj: Any) -> Any:
+    """Stdlib ``json`` fallback for the enum fields of the flattened config."""
+    try:
+        return _ENUM_VALUES[obj]
+    except (KeyError, TypeError):
+        raise TypeError(f"Object of type {type(obj)} is not JSON serializable") from None
+
+
+def _dumps_dataclass(obj: Any) -> str:
+    """Encode a config or metrics dataclass JSON column.
+    
+    orjson encodes dataclasses and enums natively, producing the same
+    document as :func:`_to_dict` without the intermediate dict.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(_to_dict(obj), default=_enum_value)
 
 
 class SQLiteManager:
-    """Manages SQLite database for benchmark results."""
+    """Manages SQLite database for benchmark results.
+    
+    The manager keeps one aiosqlite connection, and with it a worker thread,
+    open between calls. Use it as ``async with SQLiteManager() as manager:``
+    or call :meth:`close` when done; the query methods do not close it.
+    """
+    
+    # Database paths whose schema has already been created in this process
+    _schema_ready: Set[Path] = set()
     
     def __init__(self):
         """Initialize the SQLite manager."""
         self.db_path: Optional[Path] = None
+        self._db: Optional[aiosqlite.Connection] = None
+        self._db_opened_for: Optional[Path] = None
+        # Path last seen to exist, so read queries skip the stat() call
+        self._db_exists_for: Optional[Path] = None
+    
+    async def __aenter__(self) -> "SQLiteManager":
+        """Enter the context; the connection opens on first use."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the connection on leaving the context."""
+        await self.close()
     
     async def save_benchmark(self, benchmark: Benchmark, output_dir: Path) -> Path:
         """Save benchmark to SQLite database.
@@ -30,196 +317,298 @@ class SQLiteManager:
         
         await self._ensure_database()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            # Insert benchmark
+        db = await self._connection()
+        # One write transaction for the whole benchmark so the journal
+        # is synced once instead of once per row
+        await db.execute("BEGIN IMMEDIATE")
+        result_rows = None
+        try:
+            # Result rows carry the largest JSON payloads; encode them in a
+            # worker thread while the benchmark and task rows are written
+            loop = asyncio.get_running_loop()
+            result_rows = loop.run_in_executor(None, self._result_rows, benchmark.results, benchmark.id)
             await self._insert_benchmark(db, benchmark)
-            
-            # Insert tasks
-            for task in benchmark.tasks:
-                await self._insert_task(db, task, benchmark.id)
-            
-            # Insert results
-            for result in benchmark.results:
-                await self._insert_result(db, result, benchmark.id)
-            
-            await db.commit()
+            await self._insert_tasks(db, benchmark.tasks, benchmark.id)
+            await _upsert_rows(db, "results", _RESULT_COLUMNS, await result_rows)
+        except BaseException:
+            if result_rows is not None:
+                result_rows.cancel()
+            await db.rollback()
+            raise
+        
+        await db.commit()
         
         return self.db_path
     
+    async def _connection(self) -> aiosqlite.Connection:
+        """Return the cached connection, opening it on first use.
+        
+        The connection is reopened if ``db_path`` has moved since it was
+        opened; call :meth:`close` once the manager is no longer needed.
+        """
+        if self._db is not None and self._db_opened_for != self.db_path:
+            await self.close()
+        
+        if self._db is None:
+            db = await aiosqlite.connect(self.db_path)
+            for pragma in _PRAGMAS:
+                await db.execute(pragma)
+            db.row_factory = aiosqlite.Row
+            self._db = db
+            self._db_opened_for = self.db_path
+        
+        return self._db
+    
+    async def close(self) -> None:
+        """Close the cached connection, if one is open.
+        
+        Required once the manager is no longer needed; otherwise the
+        connection's worker thread outlives it.
+        """
+        if self._db is not None:
+            db, self._db, self._db_opened_for = self._db, None, None
+            try:
+                await db.execute("PRAGMA optimize")
+            finally:
+                await db.close()
+    
     async def _ensure_database(self) -> None:
         """Ensure database and tables exist."""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Create benchmarks table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS benchmarks (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    description TEXT,
-                    status TEXT NOT NULL,
-                    strategy TEXT NOT NULL,
-                    mode TEXT NOT NULL,
-                    config TEXT,
-                    metrics TEXT,
-                    created_at TEXT NOT NULL,
-                    started_at TEXT,
-                    completed_at TEXT,
-                    duration REAL,
-                    error_log TEXT,
-                    metadata TEXT
-                )
-            """)
-            
-            # Create tasks table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id TEXT PRIMARY KEY,
-                    benchmark_id TEXT NOT NULL,
-                    objective TEXT NOT NULL,
-                    description TEXT,
-                    strategy TEXT NOT NULL,
-                    mode TEXT NOT NULL,
-                    parameters TEXT,
-                    timeout INTEGER,
-                    max_retries INTEGER,
-                    priority INTEGER,
-                    status TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    started_at TEXT,
-                    completed_at TEXT,
-                    duration REAL,
-                    assigned_agents TEXT,
-                    parent_task_id TEXT,
-                    subtasks TEXT,
-                    dependencies TEXT,
-                    FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id)
-                )
-            """)
-            
-            # Create results table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS results (
-                    id TEXT PRIMARY KEY,
-                    benchmark_id TEXT NOT NULL,
-                    task_id TEXT NOT NULL,
-                    agent_id TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    output TEXT,
-                    errors TEXT,
-                    warnings TEXT,
-                    performance_metrics TEXT,
-                    quality_metrics TEXT,
-                    resource_usage TEXT,
-                    execution_details TEXT,
-                    created_at TEXT NOT NULL,
-                    started_at TEXT,
-                    completed_at TEXT,
-                    duration REAL,
-                    FOREIGN KEY (benchmark_id) REFERENCES benchmarks (id),
-                    FOREIGN KEY (task_id) REFERENCES tasks (id)
-                )
-            """)
-            
-            # Create indexes for better query performance
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_created_at ON benchmarks (created_at)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_strategy ON benchmarks (strategy)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_mode ON benchmarks (mode)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_tasks_benchmark_id ON tasks (benchmark_id)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_results_benchmark_id ON results (benchmark_id)")
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_results_task_id ON results (task_id)")
+        if self.db_path in SQLiteManager._schema_ready and self.db_path.exists():
+            self._db_exists_for = self.db_path
+            return
+        
+        db = await self._connection()
+        # All DDL goes in one transaction so it is synced once; roll back on
+        # failure so the cached connection isn't left inside a transaction
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            await self._create_schema(db)
+        except BaseException:
+            await db.rollback()
+            raise
+        
+        await db.commit()
+        SQLiteManager._schema_ready.add(self.db_path)
+        self._db_exists_for = self.db_path
+    
+    async def _create_schema(self, db: aiosqlite.Connection) -> None:
+        """Create tables and indexes inside the caller's transaction."""
+        cursor = await db.execute("PRAGMA user_version")
+        version = (await cursor.fetchone())[0]
+        migrated = version < _SCHEMA_VERSION and await self._migrate_timestamps(db)
+        
+        for table, ddl in _TABLE_DDL.items():
+            await db.execute(ddl.format(table=table))
+        
+        # query_benchmarks filters on strategy and/or mode and orders by
+        # created_at, so each filter combination gets an index that also
+        # yields rows in order; these supersede the single-column indexes
+        cursor = await db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_benchmarks_strategy_mode_created'"
+        )
+        new_query_indexes = await cursor.fetchone() is None
+        
+        # Create indexes for better query performance
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_created_at ON benchmarks (created_at)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_strategy_mode_created ON benchmarks (strategy, mode, created_at DESC)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_strategy_created ON benchmarks (strategy, created_at DESC)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_benchmarks_mode_created ON benchmarks (mode, created_at DESC)")
+        await db.execute("DROP INDEX IF EXISTS idx_benchmarks_strategy")
+        await db.execute("DROP INDEX IF EXISTS idx_benchmarks_mode")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_tasks_benchmark_id ON tasks (benchmark_id)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_results_benchmark_id ON results (benchmark_id)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_results_task_id ON results (task_id)")
+        
+        # Give the planner statistics for query_benchmarks the first time
+        # the schema is created; PRAGMA optimize on close keeps them fresh
+        cursor = await db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        )
+        if migrated or await cursor.fetchone() is None:
+            await db.execute("ANALYZE")
+        elif new_query_indexes:
+            await db.execute("ANALYZE benchmarks")
+        
+        await db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    
+    async def _migrate_timestamps(self, db: aiosqlite.Connection) -> bool:
+        """Rebuild version 0 tables with INTEGER timestamp columns.
+        
+        Version 0 declared the timestamp columns TEXT, and TEXT affinity would
+        store new integers as digit strings that sort before the old ISO
+        values. Each existing table is copied into a replacement with the
+        current definition, converting its timestamps on the way, and the
+        replacement takes the old table's name. Indexes are recreated by
+        :meth:`_create_schema`.
+        
+        Returns:
+            Whether any table was rebuilt
+        """
+        await db.create_function("iso_to_micros", 1, _iso_to_micros, deterministic=True)
+        migrated = False
+        for table, ddl in _TABLE_DDL.items():
+            cursor = await db.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            )
+            if await cursor.fetchone() is None:
+                continue
             
-            await db.commit()
+            columns = _TABLE_COLUMNS[table]
+            selected = ", ".join(
+                f"iso_to_micros({column})" if column in _TIMESTAMP_COLUMNS else column
+                for column in columns
+            )
+            await db.execute(ddl.format(table=f"{table}_v1"))
+            await db.execute(
+                f"INSERT INTO {table}_v1 ({', '.join(columns)}) SELECT {selected} FROM {table}"
+            )
+            await db.execute(f"DROP TABLE {table}")
+            await db.execute(f"ALTER TABLE {table}_v1 RENAME TO {table}")
+            migrated = True
+        return migrated
+    
+    def _db_available(self) -> bool:
+        """Return whether the database file exists, caching a positive answer."""
+        if not self.db_path:
+            return False
+        if self.db_path != self._db_exists_for:
+            if not self.db_path.exists():
+                return False
+            self._db_exists_for = self.db_path
+        return True
     
     async def _insert_benchmark(self, db: aiosqlite.Connection, benchmark: Benchmark) -> None:
         """Insert benchmark into database."""
-        await db.execute("""
-            INSERT OR REPLACE INTO benchmarks (
-                id, name, description, status, strategy, mode, config, metrics,
-                created_at, started_at, completed_at, duration, error_log, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        await db.execute(_SQL_INSERT_BENCHMARK, (
             benchmark.id,
             benchmark.name,
             benchmark.description,
-            benchmark.status.value,
-            benchmark.config.strategy.value,
-            benchmark.config.mode.value,
-            json.dumps(self._config_to_dict(benchmark.config)),
-            json.dumps(self._metrics_to_dict(benchmark.metrics)),
-            benchmark.created_at.isoformat(),
-            benchmark.started_at.isoformat() if benchmark.started_at else None,
-            benchmark.completed_at.isoformat() if benchmark.completed_at else None,
+            _ENUM_VALUES[benchmark.status],
+            _ENUM_VALUES[benchmark.config.strategy],
+            _ENUM_VALUES[benchmark.config.mode],
+            _dumps_dataclass(benchmark.config),
+            _dumps_dataclass(benchmark.metrics),
+            _to_micros(benchmark.created_at),
+            _to_micros(benchmark.started_at),
+            _to_micros(benchmark.completed_at),
             benchmark.duration(),
-            json.dumps(benchmark.error_log),
-            json.dumps(benchmark.metadata)
+            _dumps(benchmark.error_log),
+            _dumps(benchmark.metadata)
         ))
     
-    async def _insert_task(self, db: aiosqlite.Connection, task: Task, benchmark_id: str) -> None:
-        """Insert task into database."""
-        await db.execute("""
-            INSERT OR REPLACE INTO tasks (
-                id, benchmark_id, objective, description, strategy, mode, parameters,
-                timeout, max_retries, priority, status, created_at, started_at,
-                completed_at, duration, assigned_agents, parent_task_id, subtasks, dependencies
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    async def _insert_tasks(self, db: aiosqlite.Connection, tasks: List[Task], benchmark_id: str) -> None:
+        """Upsert tasks into database in multi-row statements."""
+        await _upsert_rows(db, "tasks", _TASK_COLUMNS, [self._task_row(task, benchmark_id) for task in tasks])
+    
+    def _task_row(self, task: Task, benchmark_id: str) -> tuple:
+        """Build the tasks table parameter tuple for a task."""
+        return (
             task.id,
             benchmark_id,
             task.objective,
             task.description,
-            task.strategy.value,
-            task.mode.value,
-            json.dumps(task.parameters),
+            _ENUM_VALUES[task.strategy],
+            _ENUM_VALUES[task.mode],
+            _dumps(task.parameters),
             task.timeout,
             task.max_retries,
             task.priority,
-            task.status.value,
-            task.created_at.isoformat(),
-            task.started_at.isoformat() if task.started_at else None,
-            task.completed_at.isoformat() if task.completed_at else None,
+            _ENUM_VALUES[task.status],
+            _to_micros(task.created_at),
+            _to_micros(task.started_at),
+            _to_micros(task.completed_at),
             task.duration(),
-            json.dumps(task.assigned_agents),
+            _dumps(task.assigned_agents),
             task.parent_task_id,
-            json.dumps(task.subtasks),
-            json.dumps(task.dependencies)
-        ))
+            _dumps(task.subtasks),
+            _dumps(task.dependencies)
+        )
+    
+    def _result_rows(self, results: List[Result], benchmark_id: str) -> List[tuple]:
+        """Build the results table parameter tuples for all results."""
+        return [self._result_row(result, benchmark_id) for result in results]
     
-    async def _insert_result(self, db: aiosqlite.Connection, result: Result, benchmark_id: str) -> None:
-        """Insert result into database."""
-        await db.execute("""
-            INSERT OR REPLACE INTO results (
-                id, benchmark_id, task_id, agent_id, status, output, errors, warnings,
-                performance_metrics, quality_metrics, resource_usage, execution_details,
-                created_at, started_at, completed_at, duration
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    def _result_row(self, result: Result, benchmark_id: str) -> tuple:
+        """Build the results table parameter tuple for a result."""
+        return (
             result.id,
             benchmark_id,
             result.task_id,
             result.agent_id,
-            result.status.value,
-            json.dumps(result.output),
-            json.dumps(result.errors),
-            json.dumps(result.warnings),
-            json.dumps(self._performance_metrics_to_dict(result.performance_metrics)),
-            json.dumps(self._quality_metrics_to_dict(result.quality_metrics)),
-            json.dumps(self._resource_usage_to_dict(result.resource_usage)),
-            json.dumps(result.execution_details),
-            result.created_at.isoformat(),
-            result.started_at.isoformat() if result.started_at else None,
-            result.completed_at.isoformat() if result.completed_at else None,
+            _ENUM_VALUES[result.status],
+            _dumps(result.output),
+            _dumps(result.errors),
+            _dumps(result.warnings),
+            _dumps_dataclass(result.performance_metrics),
+            _dumps_dataclass(result.quality_metrics),
+            _dumps_dataclass(result.resource_usage),
+            _dumps(result.execution_details),
+            _to_micros(result.created_at),
+            _to_micros(result.started_at),
+            _to_micros(result.completed_at),
             result.duration()
-        ))
+        )
     
     async def query_benchmarks(self, 
                               strategy: Optional[str] = None,
                               mode: Optional[str] = None,
                               limit: int = 10) -> List[Dict[str, Any]]:
         """Query benchmarks from database."""
-        if not self.db_path or not self.db_path.exists():
-            return []
+        return [row async for row in self.iter_benchmarks(strategy, mode, limit)]
+    
+    async def iter_benchmarks(self,
+                              strategy: Optional[str] = None,
+                              mode: Optional[str] = None,
+                              limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Yield benchmarks from database one row at a time.
+        
+        Same filters and order as :meth:`query_benchmarks`, without holding
+        the whole result set in memory.
+        """
+        if not self._db_available():
+            return
         
+        db = await self._connection()
+        cursor = await db.execute(*self._benchmark_query(strategy, mode, limit))
+        async for row in cursor:
+            yield _decode_row(row)
+    
+    async def query_benchmarks_json(self,
+                                    strategy: Optional[str] = None,
+                                    mode: Optional[str] = None,
+                                    limit: int = 10) -> bytes:
+        """Query benchmarks and return them encoded as a JSON array.
+        
+        Equivalent to JSON-encoding :meth:`query_benchmarks`, except that the
+        stored JSON columns are embedded as documents rather than strings.
+        Rows are encoded straight from the cursor without intermediate
+        dicts, and with orjson >= 3.9 the stored JSON is spliced in as-is.
+        """
+        if not self._db_available():
+            return b"[]"
+        
+        db = await self._connection()
+        cursor = await db.execute(*self._benchmark_query(strategy, mode, limit))
+        rows = await cursor.fetchall()
+        columns = [description[0] for description in cursor.description]
+        converters = [_JSON_COLUMN_CONVERTERS.get(column) for column in columns]
+        
+        records = [
+            {
+                column: value if convert is None or value is None else convert(value)
+                for column, convert, value in zip(columns, converters, row)
+            }
+            for row in rows
+        ]
+        if orjson is not None:
+            return orjson.dumps(records)
+        return json.dumps(records).encode("utf-8")
+    
+    def _benchmark_query(self, strategy: Optional[str], mode: Optional[str], limit: int) -> Tuple[str, List[Any]]:
+        """Build the filtered benchmarks SELECT and its parameters."""
         query = "SELECT * FROM benchmarks WHERE 1=1"
-        params = []
+        params: List[Any] = []
         
         if strategy:
             query += " AND strategy = ?"
@@ -231,100 +620,14 @@ class SQLiteManager:
         
         query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
-        
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(query, params)
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        return query, params
     
     async def get_benchmark(self, benchmark_id: str) -> Optional[Dict[str, Any]]:
         """Get specific benchmark by ID."""
-        if not self.db_path or not self.db_path.exists():
+        if not self._db_available():
             return None
         
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT * FROM benchmarks WHERE id = ?", (benchmark_id,))
-            row = await cursor.fetchone()
-            return dict(row) if row else None
-    
-    def _config_to_dict(self, config) -> Dict[str, Any]:
-        """Convert config to dictionary."""
-        return {
-            "name": config.name,
-            "description": config.description,
-            "strategy": config.strategy.value,
-            "mode": config.mode.value,
-            "max_agents": config.max_agents,
-            "max_tasks": config.max_tasks,
-            "timeout": config.timeout,
-            "task_timeout": config.task_timeout,
-            "max_retries": config.max_retries,
-            "parallel": config.parallel,
-            "background": config.background,
-            "monitoring": config.monitoring,
-            "quality_threshold": config.quality_threshold,
-            "resource_limits": config.resource_limits,
-            "output_formats": config.output_formats,
-            "output_directory": config.output_directory,
-            "verbose": config.verbose
-        }
-    
-    def _metrics_to_dict(self, metrics: BenchmarkMetrics) -> Dict[str, Any]:
-        """Convert metrics to dictionary."""
-        return {
-            "total_tasks": metrics.total_tasks,
-            "completed_tasks": metrics.completed_tasks,
-            "failed_tasks": metrics.failed_tasks,
-            "total_agents": metrics.total_agents,
-            "active_agents": metrics.active_agents,
-            "average_execution_time": metrics.average_execution_time,
-            "total_execution_time": metrics.total_execution_time,
-            "success_rate": metrics.success_rate,
-            "throughput": metrics.throughput,
-            "resource_efficiency": metrics.resource_efficiency,
-            "coordination_efficiency": metrics.coordination_efficiency,
-            "quality_score": metrics.quality_score,
-            "peak_memory_usage": metrics.peak_memory_usage,
-            "total_cpu_time": metrics.total_cpu_time,
-            "network_overhead": metrics.network_overhead
-        }
-    
-    def _performance_metrics_to_dict(self, metrics) -> Dict[str, Any]:
-        """Convert performance metrics to dictionary."""
-        return {
-            "execution_time": metrics.execution_time,
-            "queue_time": metrics.queue_time,
-            "throughput": metrics.throughput,
-            "success_rate": metrics.success_rate,
-            "error_rate": metrics.error_rate,
-            "retry_count": metrics.retry_count,
-            "coordination_overhead": metrics.coordination_overhead,
-            "communication_latency": metrics.communication_latency
-        }
-    
-    def _quality_metrics_to_dict(self, metrics) -> Dict[str, Any]:
-        """Convert quality metrics to dictionary."""
-        return {
-            "accuracy_score": metrics.accuracy_score,
-            "completeness_score": metrics.completeness_score,
-            "consistency_score": metrics.consistency_score,
-            "relevance_score": metrics.relevance_score,
-            "overall_quality": metrics.overall_quality,
-            "review_score": metrics.review_score,
-            "automated_score": metrics.automated_score
-        }
-    
-    def _resource_usage_to_dict(self, usage) -> Dict[str, Any]:
-        """Convert resource usage to dictionary."""
-        return {
-            "cpu_percent": usage.cpu_percent,
-            "memory_mb": usage.memory_mb,
-            "network_bytes_sent": usage.network_bytes_sent,
-            "network_bytes_recv": usage.network_bytes_recv,
-            "disk_bytes_read": usage.disk_bytes_read,
-            "disk_bytes_write": usage.disk_bytes_write,
-            "peak_memory_mb": usage.peak_memory_mb,
-            "average_cpu_percent": usage.average_cpu_percent
-        }
\ No newline at end of file
+        db = await self._connection()
+        cursor = await db.execute(_SQL_GET_BENCHMARK, (benchmark_id,))
+        row = await cursor.fetchone()
+        return _decode_row(row) if row else None
@@ -1,11 +1,46 @@
 """Auto strategy that automatically selects the best approach."""
 
 import re
-from typing import Dict, Any
+from typing import Any, Dict, Pattern, Tuple
 from swarm_benchmark.core.models import Task, Result, ResultStatus
 from .base_strategy import BaseStrategy
 
 
+def _compile(*patterns: str) -> Tuple[Pattern[str], ...]:
+    """Compile a strategy's keyword patterns."""
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+# Keyword patterns per strategy, compiled once at import instead of being
+# looked up in the re cache for every pattern of every task
+_STRATEGY_PATTERNS: Dict[str, Tuple[Pattern[str], ...]] = {
+    "research": _compile(
+        r"\bresearch\b", r"\binvestigate\b", r"\banalyze\b", r"\bstudy\b",
+        r"\bexplore\b", r"\bfind out\b", r"\blearn about\b", r"\bgather\b"
+    ),
+    "development": _compile(
+        r"\bbuild\b", r"\bcreate\b", r"\bdevelop\b", r"\bimplement\b",
+        r"\bcode\b", r"\bapi\b", r"\bapplication\b", r"\bsoftware\b"
+    ),
+    "analysis": _compile(
+        r"\banalyze\b", r"\bprocess\b", r"\bdata\b", r"\bmetrics\b",
+        r"\btrends\b", r"\bpatterns\b", r"\binsights\b", r"\bstatistics\b"
+    ),
+    "testing": _compile(
+        r"\btest\b", r"\bvalidate\b", r"\bverify\b", r"\bquality\b",
+        r"\bbug\b", r"\berror\b", r"\bassurance\b", r"\bcheck\b"
+    ),
+    "optimization": _compile(
+        r"\boptimize\b", r"\bperformance\b", r"\bspeed\b", r"\befficiency\b",
+        r"\bimprove\b", r"\bfaster\b", r"\btune\b", r"\bscale\b"
+    ),
+    "maintenance": _compile(
+        r"\bmaintain\b", r"\bupdate\b", r"\bfix\b", r"\brefactor\b",
+        r"\bcleanup\b", r"\brepair\b", r"\bupgrade\b", r"\bdocument\b"
+    ),
+}
+
+
 class AutoStrategy(BaseStrategy):
     """Strategy that automatically determines the best approach."""
     
@@ -13,32 +48,7 @@ class AutoStrategy(BaseStrategy):
         """Initialize the auto strategy."""
         super().__init__()
         self._selection_count = {}
-        self._strategy_patterns = {
-            "research": [
-                r"\bresearch\b", r"\binvestigate\b", r"\banalyze\b", r"\bstudy\b",
-                r"\bexplore\b", r"\bfind out\b", r"\blearn about\b", r"\bgather\b"
-            ],
-            "development": [
-                r"\bbuild\b", r"\bcreate\b", r"\bdevelop\b", r"\bimplement\b",
-                r"\bcode\b", r"\bapi\b", r"\bapplication\b", r"\bsoftware\b"
-            ],
-            "analysis": [
-                r"\banalyze\b", r"\bprocess\b", r"\bdata\b", r"\bmetrics\b",
-                r"\btrends\b", r"\bpatterns\b", r"\binsights\b", r"\bstatistics\b"
-            ],
-            "testing": [
-                r"\btest\b", r"\bvalidate\b", r"\bverify\b", r"\bquality\b",
-                r"\bbug\b", r"\berror\b", r"\bassurance\b", r"\bcheck\b"
-            ],
-            "optimization": [
-                r"\boptimize\b", r"\bperformance\b", r"\bspeed\b", r"\befficiency\b",
-                r"\bimprove\b", r"\bfaster\b", r"\btune\b", r"\bscale\b"
-            ],
-            "maintenance": [
-                r"\bmaintain\b", r"\bupdate\b", r"\bfix\b", r"\brefactor\b",
-                r"\bcleanup\b", r"\brepair\b", r"\bupgrade\b", r"\bdocument\b"
-            ]
-        }
+        self._strategy_patterns = _STRATEGY_PATTERNS
     
     @property
     def name(self) -> str:
@@ -67,7 +77,7 @@ class AutoStrategy(BaseStrategy):
         for strategy_name, patterns in self._strategy_patterns.items():
             score = 0
             for pattern in patterns:
-                matches = len(re.findall(pattern, text_to_analyze))
+                matches = len(pattern.findall(text_to_analyze))
                 score += matches
             strategy_scores[strategy_name] = score
         
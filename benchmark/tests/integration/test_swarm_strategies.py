@@ -260,7 +260,7 @@ class TestSwarmStrategies:
                     try:
                         performance_data["cpu"].append(process.cpu_percent(interval=0.1))
                         performance_data["memory"].append(process.memory_info().rss / 1024 / 1024)  # MB
-                        time.sleep(0.5)
+                        stop_monitoring.wait(0.5)
                     except:
                         break
                         
@@ -0,0 +1,178 @@
+"""Unit tests for CLI option parsing."""
+
+import asyncio
+import json
+import sys
+import types
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from swarm_benchmark.cli.main import (
+    EnumChoice, _build_config, _echo_json, _mode_map, _run_async, _strategy_map, cli
+)
+from swarm_benchmark.core.models import CoordinationMode, StrategyType
+
+
+class TestEnumChoice(unittest.TestCase):
+    """Test EnumChoice conversion to enum members."""
+
+    def setUp(self):
+        """Set up strategy and mode choices."""
+        self.strategy = EnumChoice([s.name.lower() for s in StrategyType], _strategy_map)
+        self.mode = EnumChoice([m.name.lower() for m in CoordinationMode], _mode_map)
+
+    def test_converts_choice_to_member(self):
+        """Test that every choice string converts to its member."""
+        for member in StrategyType:
+            self.assertIs(self.strategy.convert(member.name.lower(), None, None), member)
+        for member in CoordinationMode:
+            self.assertIs(self.mode.convert(member.name.lower(), None, None), member)
+
+    def test_member_passes_through(self):
+        """Test that an already converted default is returned unchanged."""
+        self.assertIs(self.strategy.convert(StrategyType.RESEARCH, None, None), StrategyType.RESEARCH)
+
+    def test_invalid_choice_raises(self):
+        """Test that unknown values get click's usage error."""
+        with self.assertRaises(click.BadParameter):
+            self.strategy.convert("unknown", None, None)
+
+    def test_case_insensitive_choice(self):
+        """Test that Choice's normalization is still applied."""
+        strategy = EnumChoice(["auto"], _strategy_map)
+        strategy.case_sensitive = False
+        self.assertIs(strategy.convert("AUTO", None, None), StrategyType.AUTO)
+
+
+
+class TestCommands(unittest.TestCase):
+    """Invoke the CLI commands end to end."""
+
+    def setUp(self):
+        """Set up a CLI runner."""
+        self.runner = CliRunner()
+
+    def test_run_writes_json_by_default(self):
+        """Test that run without --output writes a JSON report."""
+        with self.runner.isolated_filesystem():
+            outcome = self.runner.invoke(cli, ["run", "Say hello", "--output-dir", "out"])
+
+            self.assertEqual(outcome.exit_code, 0, outcome.output)
+            self.assertIn("Benchmark completed successfully", outcome.output)
+            reports = list(Path("out").glob("*.json"))
+            self.assertEqual(len(reports), 1)
+            report = json.loads(reports[0].read_text())
+            self.assertEqual(report["config"]["output_formats"], ["json"])
+            self.assertEqual(report["config"]["strategy"], "auto")
+
+    def test_run_with_output_options(self):
+        """Test that repeated --output options reach the config as a list."""
+        with self.runner.isolated_filesystem():
+            outcome = self.runner.invoke(cli, [
+                "run", "Say hello", "--strategy", "research", "--mode", "mesh",
+                "--output", "json", "--output", "sqlite", "--output-dir", "out"
+            ])
+
+            self.assertEqual(outcome.exit_code, 0, outcome.output)
+            report = json.loads(next(Path("out").glob("*.json")).read_text())
+            self.assertEqual(report["config"]["output_formats"], ["json", "sqlite"])
+            self.assertEqual(report["config"]["mode"], "mesh")
+            self.assertTrue(Path("out", "benchmark_results.db").exists())
+
+    @patch("swarm_benchmark.cli.main._run_real_benchmark", new_callable=AsyncMock)
+    def test_real_builds_config(self, run_real):
+        """Test that real parses its options and runs the benchmark."""
+        run_real.return_value = {"status": "success"}
+
+        outcome = self.runner.invoke(cli, [
+            "real", "Say hello", "--strategy", "development", "--sparc-mode", "coder",
+            "--output-dir", "out"
+        ])
+
+        self.assertEqual(outcome.exit_code, 0, outcome.output)
+        self.assertIn("Real benchmark completed successfully", outcome.output)
+        objective, config, sparc_mode, all_modes = run_real.await_args.args
+        self.assertEqual(objective, "Say hello")
+        self.assertEqual(config.strategy, StrategyType.DEVELOPMENT)
+        self.assertEqual(config.output_formats, ["json"])
+        self.assertEqual(config.output_directory, "out")
+        self.assertEqual((sparc_mode, all_modes), ("coder", False))
+
+    def test_configs_are_not_shared(self):
+        """Test that equal options still build independent configs."""
+        first = _build_config(name="same", output_formats=["json"])
+        second = _build_config(name="same", output_formats=["json"])
+        first.resource_limits["max_memory_mb"] = 512
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.resource_limits["max_memory_mb"], 1024)
+
+    def test_list_command_name(self):
+        """Test that the list command is still registered as "list"."""
+        outcome = self.runner.invoke(cli, ["list", "--format", "json"])
+
+        self.assertEqual(outcome.exit_code, 0, outcome.output)
+        self.assertEqual(json.loads(outcome.output), [])
+
+
+
+class TestEchoJSON(unittest.TestCase):
+    """Test that JSON output doesn't depend on orjson being installed."""
+
+    DATA = {1: {"when": datetime(2025, 1, 2, 3, 4, 5, 6)}, "day": [date(2025, 1, 1)]}
+    EXPECTED = {"1": {"when": "2025-01-02T03:04:05.000006"}, "day": ["2025-01-01"]}
+
+    def _echo(self):
+        command = click.command()(lambda: _echo_json(self.DATA))
+        outcome = CliRunner().invoke(command)
+        self.assertEqual(outcome.exit_code, 0, outcome.output)
+        return json.loads(outcome.output)
+
+    def test_with_orjson(self):
+        """Test the orjson path, if orjson is installed."""
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            self.skipTest("orjson is not installed")
+        self.assertEqual(self._echo(), self.EXPECTED)
+
+    def test_without_orjson(self):
+        """Test the stdlib fallback."""
+        with patch.dict(sys.modules, {"orjson": None}):
+            self.assertEqual(self._echo(), self.EXPECTED)
+
+
+class TestRunAsync(unittest.TestCase):
+    """Test the CLI's event loop selection."""
+
+    async def _answer(self):
+        await asyncio.sleep(0)
+        return 42
+
+    def test_runs_without_uvloop(self):
+        """Test the plain asyncio.run path."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            self.assertEqual(_run_async(self._answer()), 42)
+
+    @unittest.skipUnless(hasattr(asyncio, "Runner") and sys.platform != "win32",
+                         "uvloop is only used through asyncio.Runner")
+    def test_uses_uvloop_factory_without_changing_policy(self):
+        """Test that uvloop is used as a loop factory, not a global policy."""
+        uvloop = types.ModuleType("uvloop")
+        uvloop.new_event_loop = MagicMock(side_effect=asyncio.new_event_loop)
+        policy = asyncio.get_event_loop_policy()
+
+        with patch.dict(sys.modules, {"uvloop": uvloop}):
+            self.assertEqual(_run_async(self._answer()), 42)
+
+        uvloop.new_event_loop.assert_called_once_with()
+        self.assertIs(asyncio.get_event_loop_policy(), policy)
+
+
+if __name__ == '__main__':
+    unittest.main()
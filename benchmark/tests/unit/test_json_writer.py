@@ -0,0 +1,168 @@
+"""Unit tests for the JSON output writer."""
+
+import io
+import json
+import unittest
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from swarm_benchmark.core.models import (
+    Benchmark, BenchmarkConfig, Task, Result, ResultStatus, StrategyType,
+    CoordinationMode, PerformanceMetrics, ResourceUsage
+)
+from swarm_benchmark.output import json_writer
+from swarm_benchmark.output.json_writer import JSONWriter
+
+
+def _isoformat(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def _legacy_dict(benchmark):
+    """Build the document the dict-based writer produced for a benchmark."""
+    config = asdict(benchmark.config)
+    config["strategy"] = benchmark.config.strategy.value
+    config["mode"] = benchmark.config.mode.value
+    tasks = [
+        {
+            "id": task.id,
+            "objective": task.objective,
+            "description": task.description,
+            "strategy": task.strategy.value,
+            "mode": task.mode.value,
+            "parameters": task.parameters,
+            "timeout": task.timeout,
+            "max_retries": task.max_retries,
+            "priority": task.priority,
+            "status": task.status.value,
+            "created_at": task.created_at,
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
+            "duration": task.duration(),
+            "assigned_agents": task.assigned_agents,
+            "parent_task_id": task.parent_task_id,
+            "subtasks": task.subtasks,
+            "dependencies": task.dependencies
+        }
+        for task in benchmark.tasks
+    ]
+    results = [
+        {
+            "id": result.id,
+            "task_id": result.task_id,
+            "agent_id": result.agent_id,
+            "status": result.status.value,
+            "output": result.output,
+            "errors": result.errors,
+            "warnings": result.warnings,
+            "performance_metrics": asdict(result.performance_metrics),
+            "quality_metrics": asdict(result.quality_metrics),
+            "resource_usage": asdict(result.resource_usage),
+            "execution_details": result.execution_details,
+            "created_at": result.created_at,
+            "started_at": result.started_at,
+            "completed_at": result.completed_at,
+            "duration": result.duration()
+        }
+        for result in benchmark.results
+    ]
+    return {
+        "id": benchmark.id,
+        "name": benchmark.name,
+        "description": benchmark.description,
+        "status": benchmark.status.value,
+        "config": config,
+        "tasks": tasks,
+        "results": results,
+        "metrics": asdict(benchmark.metrics),
+        "created_at": benchmark.created_at,
+        "started_at": benchmark.started_at,
+        "completed_at": benchmark.completed_at,
+        "duration": benchmark.duration(),
+        "error_log": benchmark.error_log,
+        "metadata": benchmark.metadata
+    }
+
+
+class TestJSONWriter(unittest.TestCase):
+    """Test JSONWriter's streamed output."""
+
+    def setUp(self):
+        """Set up a populated benchmark."""
+        start = datetime(2025, 1, 2, 3, 4, 5, 678901)
+        self.benchmark = Benchmark(
+            name="writer",
+            description="line one\nline two",
+            config=BenchmarkConfig(strategy=StrategyType.RESEARCH, mode=CoordinationMode.MESH),
+            started_at=start,
+            completed_at=start + timedelta(seconds=2),
+            error_log=["first"],
+            metadata={"nested": {"values": [1, 2.5, None]}, "unicode": "é☃"}
+        )
+        for index in range(3):
+            task = Task(objective=f"task {index}", parameters={"index": index},
+                        dependencies=[f"dep{index}"])
+            self.benchmark.add_task(task)
+            self.benchmark.add_result(Result(
+                task_id=task.id,
+                agent_id=f"agent{index}",
+                status=ResultStatus.SUCCESS,
+                output={"text": "multi\nline", "items": []},
+                performance_metrics=PerformanceMetrics(execution_time=index + 0.5),
+                resource_usage=ResourceUsage(cpu_percent=12.5, memory_mb=64.0),
+                started_at=start,
+                completed_at=start + timedelta(milliseconds=250)
+            ))
+
+    def _encode(self, benchmark, pretty):
+        buffer = io.BytesIO()
+        JSONWriter(pretty=pretty)._write_benchmark(benchmark, buffer)
+        return buffer.getvalue()
+
+    def _assertMatchesLegacy(self, benchmark):
+        expected = json.loads(json.dumps(_legacy_dict(benchmark), default=_isoformat))
+        for pretty in (False, True):
+            with self.subTest(pretty=pretty):
+                self.assertEqual(json.loads(self._encode(benchmark, pretty)), expected)
+
+    def test_matches_dict_output(self):
+        """Test that the streamed document equals the dict-based one."""
+        self._assertMatchesLegacy(self.benchmark)
+
+    def test_matches_dict_output_without_orjson(self):
+        """Test the stdlib fallback encoder produces the same document."""
+        with patch.object(json_writer, "orjson", None):
+            self._assertMatchesLegacy(self.benchmark)
+
+    def test_empty_tasks_and_results(self):
+        """Test that empty arrays are written as []."""
+        benchmark = Benchmark(name="empty")
+        self._assertMatchesLegacy(benchmark)
+        self.assertIn(b'"tasks":[]', self._encode(benchmark, False))
+        self.assertIn(b'"results": []', self._encode(benchmark, True))
+
+    def _assertLayout(self, pretty, expected):
+        """Check the exact bytes with orjson (if installed) and the stdlib encoder."""
+        encoders = [("stdlib", None)]
+        if json_writer.orjson is not None:
+            encoders.append(("orjson", json_writer.orjson))
+        for label, module in encoders:
+            with self.subTest(encoder=label), patch.object(json_writer, "orjson", module):
+                self.assertEqual(self._encode(self.benchmark, pretty).decode("utf-8"), expected)
+
+    def test_pretty_layout(self):
+        """Test that pretty output is laid out like json.dumps(indent=2)."""
+        self._assertLayout(True, json.dumps(_legacy_dict(self.benchmark), indent=2,
+                                            default=_isoformat, ensure_ascii=False))
+
+    def test_compact_layout(self):
+        """Test that compact output has no insignificant whitespace."""
+        self._assertLayout(False, json.dumps(_legacy_dict(self.benchmark), separators=(",", ":"),
+                                             default=_isoformat, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
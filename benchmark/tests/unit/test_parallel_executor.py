@@ -0,0 +1,130 @@
+"""Unit tests for the parallel executor's result waiting."""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from swarm_benchmark.core.models import Result, ResultStatus, Task
+from swarm_benchmark.core.parallel_executor import (
+    ExecutionMode, ParallelExecutor, ResourceLimits
+)
+
+
+def _executor():
+    return ParallelExecutor(
+        mode=ExecutionMode.ASYNCIO,
+        limits=ResourceLimits(max_concurrent_tasks=2, monitoring_interval=0.05)
+    )
+
+
+async def _succeed(self, task):
+    await asyncio.sleep(0.05)
+    return Result(task_id=task.id, agent_id="agent", status=ResultStatus.SUCCESS)
+
+
+async def _fail(self, task):
+    raise RuntimeError("task exploded")
+
+
+class TestParallelExecutorWaits(unittest.TestCase):
+    """Test get_result and wait_for_completion."""
+
+    def test_get_result_times_out(self):
+        """Test that an unfinished task's result is None after the timeout."""
+        async def run_test():
+            executor = _executor()
+            started = time.perf_counter()
+            result = await executor.get_result("missing", timeout=0.1)
+            return result, time.perf_counter() - started
+
+        result, elapsed = asyncio.run(run_test())
+
+        self.assertIsNone(result)
+        self.assertGreaterEqual(elapsed, 0.1)
+        self.assertLess(elapsed, 1.0)
+
+    def test_wait_for_completion_times_out(self):
+        """Test that outstanding tasks make wait_for_completion return False."""
+        async def run_test():
+            executor = _executor()
+            executor.metrics.tasks_queued = 1
+            return await executor.wait_for_completion(timeout=0.1)
+
+        self.assertFalse(asyncio.run(run_test()))
+
+    def test_wait_for_completion_without_tasks(self):
+        """Test that nothing queued counts as complete."""
+        async def run_test():
+            return await _executor().wait_for_completion(timeout=0)
+
+        self.assertTrue(asyncio.run(run_test()))
+
+    @patch.object(ParallelExecutor, "_execute_task", _succeed)
+    def test_waiters_wake_on_completion(self):
+        """Test that waiters return the result once the task completes."""
+        task = Task(objective="wake")
+
+        async def run_test():
+            executor = _executor()
+            await executor.start()
+            try:
+                await executor.submit_task(task)
+                result = await executor.get_result(task.id, timeout=5)
+                completed = await executor.wait_for_completion(timeout=5)
+            finally:
+                await executor.stop()
+            return result, completed
+
+        result, completed = asyncio.run(run_test())
+
+        self.assertEqual(result.task_id, task.id)
+        self.assertEqual(result.status, ResultStatus.SUCCESS)
+        self.assertTrue(completed)
+
+    @patch.object(ParallelExecutor, "_execute_task", _succeed)
+    def test_zero_timeout_waits_indefinitely(self):
+        """Test that timeout=0 means no timeout rather than an immediate one."""
+        task = Task(objective="no timeout")
+
+        async def run_test():
+            executor = _executor()
+            await executor.start()
+            try:
+                await executor.submit_task(task)
+                result = await asyncio.wait_for(executor.get_result(task.id, timeout=0), 5)
+                completed = await asyncio.wait_for(executor.wait_for_completion(timeout=0), 5)
+            finally:
+                await executor.stop()
+            return result, completed
+
+        result, completed = asyncio.run(run_test())
+
+        self.assertEqual(result.task_id, task.id)
+        self.assertTrue(completed)
+
+    @patch.object(ParallelExecutor, "_execute_task", _fail)
+    def test_failed_task_result(self):
+        """Test that a failed task wakes waiters with an error result."""
+        task = Task(objective="fail")
+
+        async def run_test():
+            executor = _executor()
+            await executor.start()
+            try:
+                await executor.submit_task(task)
+                result = await executor.get_result(task.id, timeout=5)
+                completed = await executor.wait_for_completion(timeout=5)
+            finally:
+                await executor.stop()
+            return result, completed
+
+        result, completed = asyncio.run(run_test())
+
+        self.assertEqual(result.status, ResultStatus.ERROR)
+        self.assertEqual(result.errors, ["task exploded"])
+        self.assertTrue(completed)
+
+
+if __name__ == '__main__':
+    unittest.main()
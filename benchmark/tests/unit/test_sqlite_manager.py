@@ -0,0 +1,388 @@
+"""Unit tests for the SQLite output manager."""
+
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from swarm_benchmark.core.models import (
+    Benchmark, BenchmarkConfig, CoordinationMode, Result, ResultStatus, StrategyType, Task
+)
+from swarm_benchmark.output import sqlite_manager
+from swarm_benchmark.output.sqlite_manager import (
+    SQLiteManager, _RESULT_COLUMNS, _SCHEMA_VERSION, _TASK_COLUMNS,
+    _from_micros, _to_micros, _upsert_sql
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Columns query_benchmarks_json embeds as JSON documents instead of strings
+JSON_COLUMNS = ("config", "metrics", "error_log", "metadata")
+
+
+# benchmarks table as created before timestamps were stored as integers
+LEGACY_BENCHMARKS_DDL = """
+    CREATE TABLE benchmarks (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT,
+        status TEXT NOT NULL,
+        strategy TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        config TEXT,
+        metrics TEXT,
+        created_at TEXT NOT NULL,
+        started_at TEXT,
+        completed_at TEXT,
+        duration REAL,
+        error_log TEXT,
+        metadata TEXT
+    )
+"""
+
+
+class TestTimestampEncoding(unittest.TestCase):
+    """Test the integer timestamp column encoding."""
+
+    def assertRoundTrips(self, values):
+        for value in values:
+            self.assertEqual(_from_micros(_to_micros(value)), value.isoformat())
+
+    def test_round_trip_is_exact(self):
+        """Test that naive datetimes decode to the same ISO string."""
+        rng = random.Random(0)
+        start = datetime(2025, 1, 1)
+        self.assertRoundTrips(
+            start + timedelta(microseconds=rng.randrange(366 * 86400 * 10**6))
+            for _ in range(20000)
+        )
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "requires time.tzset")
+    def test_round_trip_ignores_local_timezone(self):
+        """Test that DST transitions in the local timezone don't shift values."""
+        saved = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+        try:
+            self.assertRoundTrips([
+                datetime(2025, 3, 9, 2, 7, 58),
+                datetime(2025, 11, 2, 1, 30, 0, 123456),
+                datetime(1969, 12, 31, 23, 59, 59, 999999),
+            ])
+        finally:
+            if saved is None:
+                del os.environ["TZ"]
+            else:
+                os.environ["TZ"] = saved
+            time.tzset()
+
+    def test_none_passes_through(self):
+        """Test that missing timestamps stay NULL."""
+        self.assertIsNone(_to_micros(None))
+        self.assertIsNone(_from_micros(None))
+
+
+class TestUpsertRows(unittest.TestCase):
+    """Test the multi-row upsert builders."""
+
+    def test_upsert_sql(self):
+        """Test the statement shape for a two-row upsert."""
+        sql = _upsert_sql("items", ("id", "name", "value"), 2)
+        self.assertEqual(
+            sql,
+            "INSERT INTO items (id, name, value) VALUES (?, ?, ?), (?, ?, ?)"
+            " ON CONFLICT(id) DO UPDATE SET name = excluded.name, value = excluded.value"
+        )
+
+    def test_row_builders_match_columns(self):
+        """Test that task and result rows have one value per column."""
+        manager = SQLiteManager()
+        task = Task(objective="columns")
+        result = Result(task_id=task.id, agent_id="agent")
+        task_row = manager._task_row(task, "bench")
+        result_row = manager._result_row(result, "bench")
+
+        self.assertEqual(len(task_row), len(_TASK_COLUMNS))
+        self.assertEqual(len(result_row), len(_RESULT_COLUMNS))
+        self.assertEqual(dict(zip(_TASK_COLUMNS, task_row))["benchmark_id"], "bench")
+        self.assertEqual(dict(zip(_RESULT_COLUMNS, result_row))["agent_id"], "agent")
+
+
+class TestSQLiteManager(unittest.TestCase):
+    """Test SQLiteManager against a temporary database."""
+
+    def setUp(self):
+        """Set up a temporary output directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp.name)
+        self.db_path = self.output_dir / "benchmark_results.db"
+
+    def tearDown(self):
+        """Remove the temporary output directory."""
+        self.tmp.cleanup()
+
+    def _create_legacy_database(self, created_at: datetime) -> None:
+        with sqlite3.connect(self.db_path) as db:
+            db.execute(LEGACY_BENCHMARKS_DDL)
+            db.execute(
+                "INSERT INTO benchmarks (id, name, status, strategy, mode, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ("legacy", "old run", "completed", "auto", "centralized", created_at.isoformat()),
+            )
+        db.close()
+
+    def test_save_and_get_benchmark(self):
+        """Test that a saved benchmark reads back with ISO timestamps."""
+        benchmark = Benchmark(name="roundtrip")
+        benchmark.started_at = benchmark.created_at + timedelta(seconds=1)
+
+        async def run_test():
+            async with SQLiteManager() as manager:
+                await manager.save_benchmark(benchmark, self.output_dir)
+                return await manager.get_benchmark(benchmark.id)
+
+        row = asyncio.run(run_test())
+
+        self.assertEqual(row["name"], "roundtrip")
+        self.assertEqual(row["created_at"], benchmark.created_at.isoformat())
+        self.assertEqual(row["started_at"], benchmark.started_at.isoformat())
+        self.assertIsNone(row["completed_at"])
+
+    def _save(self, benchmark):
+        async def run_test():
+            async with SQLiteManager() as manager:
+                await manager.save_benchmark(benchmark, self.output_dir)
+
+        asyncio.run(run_test())
+
+    def _rows(self, sql):
+        with sqlite3.connect(self.db_path) as db:
+            rows = db.execute(sql).fetchall()
+        db.close()
+        return rows
+
+    def test_saves_rows_across_upsert_chunks(self):
+        """Test that rows split over several statements are all written."""
+        benchmark = Benchmark(name="chunks")
+        for index in range(7):
+            task = Task(objective=f"task {index}", parameters={"index": index})
+            benchmark.add_task(task)
+            benchmark.add_result(Result(task_id=task.id, agent_id=f"agent{index}",
+                                        output={"index": index}))
+
+        with patch.object(sqlite_manager, "_UPSERT_CHUNK_ROWS", 3):
+            self._save(benchmark)
+
+        tasks = self._rows("SELECT id, parameters FROM tasks ORDER BY objective")
+        results = self._rows("SELECT task_id, output FROM results ORDER BY agent_id")
+        self.assertEqual([task_id for task_id, _ in tasks], [task.id for task in benchmark.tasks])
+        self.assertEqual([json.loads(parameters)["index"] for _, parameters in tasks], list(range(7)))
+        self.assertEqual([task_id for task_id, _ in results], [task.id for task in benchmark.tasks])
+        self.assertEqual([json.loads(output)["index"] for _, output in results], list(range(7)))
+
+    def test_resave_updates_rows_in_place(self):
+        """Test that saving a benchmark again updates its rows."""
+        benchmark = Benchmark(name="resave")
+        task = Task(objective="before")
+        result = Result(task_id=task.id, agent_id="agent")
+        benchmark.add_task(task)
+        benchmark.add_result(result)
+        self._save(benchmark)
+
+        task.objective = "after"
+        result.status = ResultStatus.FAILURE
+        self._save(benchmark)
+
+        self.assertEqual(self._rows("SELECT objective FROM tasks"), [("after",)])
+        self.assertEqual(self._rows("SELECT status FROM results"), [(ResultStatus.FAILURE.value,)])
+
+    def test_empty_benchmark(self):
+        """Test that a benchmark without tasks or results is saved."""
+        benchmark = Benchmark(name="empty")
+        self._save(benchmark)
+
+        self.assertEqual(self._rows("SELECT id FROM benchmarks"), [(benchmark.id,)])
+        self.assertEqual(self._rows("SELECT COUNT(*) FROM tasks"), [(0,)])
+        self.assertEqual(self._rows("SELECT COUNT(*) FROM results"), [(0,)])
+
+    def _save_runs(self):
+        """Save three benchmarks a minute apart, oldest first."""
+        start = datetime(2025, 5, 1, 9, 0, 0, 123456)
+        combos = [
+            (StrategyType.RESEARCH, CoordinationMode.MESH),
+            (StrategyType.DEVELOPMENT, CoordinationMode.MESH),
+            (StrategyType.RESEARCH, CoordinationMode.HIERARCHICAL),
+        ]
+        benchmarks = []
+        for index, (strategy, mode) in enumerate(combos):
+            benchmark = Benchmark(
+                name=f"run {index}",
+                config=BenchmarkConfig(strategy=strategy, mode=mode),
+                created_at=start + timedelta(minutes=index),
+                error_log=[f"error {index}"],
+                metadata={"index": index, "label": "é"}
+            )
+            benchmarks.append(benchmark)
+            self._save(benchmark)
+        return benchmarks
+
+    def _query_json(self, **filters):
+        async def run_test():
+            async with SQLiteManager() as manager:
+                manager.db_path = self.db_path
+                return (await manager.query_benchmarks_json(**filters),
+                        await manager.query_benchmarks(**filters))
+
+        encoded, rows = asyncio.run(run_test())
+        self.assertIsInstance(encoded, bytes)
+        return json.loads(encoded), rows
+
+    def _assertJSONMatchesRows(self, embed, encoder, **filters):
+        """Check query_benchmarks_json against query_benchmarks for one embed branch."""
+        converters = {column: embed for column in JSON_COLUMNS}
+        with patch.dict(sqlite_manager._JSON_COLUMN_CONVERTERS, converters), \
+                patch.object(sqlite_manager, "orjson", encoder):
+            records, rows = self._query_json(**filters)
+
+        for row in rows:
+            for column in JSON_COLUMNS:
+                row[column] = json.loads(row[column])
+        self.assertEqual(records, rows)
+        return records
+
+    @unittest.skipUnless(orjson is not None and hasattr(orjson, "Fragment"),
+                         "requires orjson >= 3.9")
+    def test_query_json_with_orjson_fragments(self):
+        """Test that stored JSON is spliced in through orjson.Fragment."""
+        self._save_runs()
+        self._assertJSONMatchesRows(orjson.Fragment, orjson)
+
+    @unittest.skipUnless(orjson is not None, "requires orjson")
+    def test_query_json_with_orjson_loads(self):
+        """Test the orjson path for releases without Fragment."""
+        self._save_runs()
+        self._assertJSONMatchesRows(orjson.loads, orjson)
+
+    def test_query_json_with_stdlib(self):
+        """Test the stdlib fallback."""
+        self._save_runs()
+        self._assertJSONMatchesRows(json.loads, None)
+
+    def test_query_json_round_trip(self):
+        """Test filters, ordering and decoded values of the JSON query."""
+        benchmarks = self._save_runs()
+
+        records, _ = self._query_json(strategy="research")
+
+        expected = [benchmarks[2], benchmarks[0]]
+        self.assertEqual([record["id"] for record in records], [b.id for b in expected])
+        self.assertEqual([record["created_at"] for record in records],
+                         [b.created_at.isoformat() for b in expected])
+        self.assertEqual(records[0]["config"]["mode"], "hierarchical")
+        self.assertEqual(records[1]["metadata"], {"index": 0, "label": "é"})
+        self.assertEqual(records[1]["error_log"], ["error 0"])
+        self.assertIsNone(records[1]["completed_at"])
+
+    def test_query_json_limit_and_missing_database(self):
+        """Test the limit, and that a missing database yields an empty array."""
+        async def missing():
+            async with SQLiteManager() as manager:
+                manager.db_path = self.db_path
+                return await manager.query_benchmarks_json()
+
+        self.assertEqual(asyncio.run(missing()), b"[]")
+
+        self._save_runs()
+        records, _ = self._query_json(mode="mesh", limit=1)
+        self.assertEqual([record["name"] for record in records], ["run 1"])
+
+    def _iter(self, **filters):
+        async def run_test():
+            async with SQLiteManager() as manager:
+                manager.db_path = self.db_path
+                streamed = [row async for row in manager.iter_benchmarks(**filters)]
+                return streamed, await manager.query_benchmarks(**filters)
+
+        return asyncio.run(run_test())
+
+    def test_iter_benchmarks_matches_query(self):
+        """Test that streamed rows equal query_benchmarks for each filter."""
+        self._save_runs()
+
+        for filters in ({}, {"strategy": "research"}, {"mode": "mesh"},
+                        {"strategy": "research", "mode": "mesh"}, {"limit": 2}):
+            with self.subTest(**filters):
+                streamed, rows = self._iter(**filters)
+                self.assertEqual(streamed, rows)
+
+    def test_iter_benchmarks_round_trip(self):
+        """Test the decoded values and order of streamed rows."""
+        benchmarks = self._save_runs()
+
+        streamed, _ = self._iter(mode="mesh")
+
+        expected = [benchmarks[1], benchmarks[0]]
+        self.assertEqual([row["id"] for row in streamed], [b.id for b in expected])
+        self.assertEqual([row["created_at"] for row in streamed],
+                         [b.created_at.isoformat() for b in expected])
+        self.assertEqual([row["strategy"] for row in streamed], ["development", "research"])
+        self.assertEqual(json.loads(streamed[0]["metadata"]), {"index": 1, "label": "é"})
+
+    def test_iter_benchmarks_missing_database(self):
+        """Test that nothing is yielded before a database exists."""
+        streamed, rows = self._iter()
+
+        self.assertEqual(streamed, [])
+        self.assertEqual(rows, [])
+        self.assertFalse(self.db_path.exists())
+
+    def test_context_manager_closes_connection(self):
+        """Test that leaving the async with block closes the connection."""
+        async def run_test():
+            async with SQLiteManager() as manager:
+                await manager.save_benchmark(Benchmark(name="closed"), self.output_dir)
+                self.assertIsNotNone(manager._db)
+            return manager
+
+        manager = asyncio.run(run_test())
+
+        self.assertIsNone(manager._db)
+
+    def test_opens_legacy_database(self):
+        """Test that a database with TEXT timestamps is migrated on open."""
+        old = datetime(2024, 6, 1, 12, 30, 0, 250000)
+        self._create_legacy_database(old)
+        benchmark = Benchmark(name="new run")
+
+        async def run_test():
+            async with SQLiteManager() as manager:
+                await manager.save_benchmark(benchmark, self.output_dir)
+                return await manager.query_benchmarks()
+
+        rows = asyncio.run(run_test())
+
+        self.assertEqual([row["id"] for row in rows], [benchmark.id, "legacy"])
+        self.assertEqual(rows[1]["created_at"], old.isoformat())
+
+        with sqlite3.connect(self.db_path) as db:
+            types = {t for (t,) in db.execute("SELECT DISTINCT typeof(created_at) FROM benchmarks")}
+            version = db.execute("PRAGMA user_version").fetchone()[0]
+            declared = {name: kind for _, name, kind, *_ in db.execute("PRAGMA table_info(benchmarks)")}
+        db.close()
+        self.assertEqual(types, {"integer"})
+        self.assertEqual(version, _SCHEMA_VERSION)
+        self.assertEqual(declared["created_at"], "INTEGER")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,17 +4,42 @@ Claude Code MCP Client 示例
 演示如何连接到 Claude Code MCP Server 并使用其功能
 """
 
+import os
 import subprocess
 import json
 import sys
 import time
 
+try:
+    import orjson  # 可选：更快的 JSON 编解码
+except ImportError:
+    orjson = None
+
+# 每次从管道读取的最大字节数
+READ_CHUNK_SIZE = 65536
+
+
+def _dumps(obj):
+    """把请求编码为 UTF-8 字节"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data):
+    """从字节解码 JSON 响应"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ClaudeCodeMCPClient:
     def __init__(self, claude_path="claude"):
         """初始化 MCP 客户端"""
         self.claude_path = claude_path
         self.process = None
         self.request_id = 0
+        self._buf = bytearray()  # stdout 中尚未消费的字节
     
     def start_server(self):
         """启动 Claude Code MCP Server"""
@@ -25,8 +50,7 @@ class ClaudeCodeMCPClient:
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1  # 行缓冲
+                bufsize=0  # 二进制无缓冲管道，由 _read_line 自行分帧
             )
             # 等待服务器启动
             time.sleep(2)
@@ -52,21 +76,36 @@ class ClaudeCodeMCPClient:
         print(f"📤 发送请求: {method}")
         try:
             # 发送请求
-            request_json = json.dumps(request) + "\n"
-            self.process.stdin.write(request_json)
-            self.process.stdin.flush()
+            self.process.stdin.write(_dumps(request) + b"\n")
             
             # 读取响应
-            response_line = self.process.stdout.readline()
+            response_line = self._read_line()
             if response_line:
-                response = json.loads(response_line.strip())
-                return response
+                return _loads(response_line)
             else:
                 raise Exception("没有收到响应")
         except Exception as e:
             print(f"❌ 请求失败: {e}")
             return None
     
+    def _read_line(self):
+        """从 stdout 读取一条以换行分隔的消息（不含换行），EOF 时返回空字节串"""
+        fd = self.process.stdout.fileno()
+        start = 0
+        while True:
+            end = self._buf.find(b"\n", start)
+            if end >= 0:
+                line = bytes(self._buf[:end])
+                del self._buf[:end + 1]
+                return line
+            start = len(self._buf)
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
+                line = bytes(self._buf)
+                self._buf.clear()
+                return line
+            self._buf += chunk
+    
     def list_tools(self):
         """获取可用工具列表"""
         print("\n📋 获取可用工具...")